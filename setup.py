@@ -15,6 +15,7 @@ setup(
     version=VERSION,
     long_description_content_type="text/markdown",
     long_description=README,
+    python_requires=">=3.7",
     install_requires=["construct==2.10.68"],
     packages=["teleparser"],
     include_package_data=True,
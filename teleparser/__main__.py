@@ -1,24 +1,75 @@
-import argparse
 import os
+import stat
+import sys
+import types
 from teleparser import VERSION, process
 
 import logger
 
 
-if __name__ == "__main__":
+def is_stat_mode(path, mode_check):
+    """Checks the file type of path with a single stat call"""
+    try:
+        return mode_check(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def parse_args_fast(argv):
+    """Parses the usual command lines without building the argparse parser,
+    returns None for anything else (help, errors...) left to argparse"""
+    verbose = None
+    workers = 1
+    positionals = []
+    argv = iter(argv)
+    for arg in argv:
+        if not arg.startswith("-"):
+            positionals.append(arg)
+        elif arg == "--verbose":
+            verbose = (verbose or 0) + 1
+        elif len(arg) > 1 and arg[1:] == "v" * (len(arg) - 1):
+            verbose = (verbose or 0) + len(arg) - 1
+        elif arg in ("-w", "--workers"):
+            value = next(argv, "")
+            if not value.isdecimal():
+                return None
+            workers = int(value)
+        else:
+            return None
+    if len(positionals) != 2:
+        return None
+    return types.SimpleNamespace(
+        infilename=positionals[0], outdirectory=positionals[1], verbose=verbose, workers=workers
+    )
+
+
+def parse_args():
+    args = parse_args_fast(sys.argv[1:])
+    if args:
+        return args
+
+    import argparse  # pylint: disable=C0415
 
     description = "Telegram parser version {}".format(VERSION)
     parser = argparse.ArgumentParser(description=description)
     parser.add_argument("infilename", help="input file cache4.db")
     parser.add_argument("outdirectory", help="output directory, must exist")
     parser.add_argument("-v", "--verbose", action="count", help="verbose level, -v to -vvv")
-    args = parser.parse_args()
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="number of processes parsing the blobs"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = parse_args()
 
     logger.configure_logging(args.verbose)
 
-    if os.path.exists(args.infilename):
-        if os.path.isdir(args.outdirectory):
-            process(args.infilename, args.outdirectory)
+    if is_stat_mode(args.infilename, stat.S_ISREG):
+        if is_stat_mode(args.outdirectory, stat.S_ISDIR):
+            process(args.infilename, args.outdirectory, args.workers)
         else:
             logger.error("Output directory [%s] does not exist!", args.outdirectory)
     else:
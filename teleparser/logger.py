@@ -15,6 +15,20 @@ warning = _logger.warning
 
 
 def configure_logging(verbosity=None):
+    log_level = logging.DEBUG
+    if not verbosity:
+        log_level = logging.ERROR
+    elif verbosity == 1:
+        log_level = logging.WARNING
+    elif verbosity == 2:
+        log_level = logging.INFO
+    elif verbosity >= 3:
+        log_level = logging.DEBUG
+
+    configure_logging_level(log_level)
+
+
+def configure_logging_level(log_level):
     for handler in logging.root.handlers:
         logging.root.removeHandler(handler)
 
@@ -27,17 +41,11 @@ def configure_logging(verbosity=None):
     formatter = logging.Formatter(format_string)
     handler.setFormatter(formatter)
 
-    log_level = logging.DEBUG
-    if not verbosity:
-        log_level = logging.ERROR
-    elif verbosity == 1:
-        log_level = logging.WARNING
-    elif verbosity == 2:
-        log_level = logging.INFO
-    elif verbosity >= 3:
-        log_level = logging.DEBUG
-
     logger.setLevel(log_level)
     handler.setLevel(log_level)
 
     logger.addHandler(handler)
+
+
+def get_level():
+    return logging.getLogger().level
@@ -29,18 +29,22 @@
 
 # pylint: disable=C0302,C0115,C0116,W0212,W0108,R0201,R0904
 
+import array
+import concurrent.futures
 import datetime
+import functools
+import multiprocessing
+import struct
+import sys
+
 from construct import (
     Struct,
     Computed,
     Peek,
-    Byte,
     IfThenElse,
     this,
     Int32ul,
-    Padding,
     If,
-    Bytes,
     Hex,
     Const,
     Int64ul,
@@ -54,22 +58,437 @@ from construct import (
     GreedyBytes,
     Terminated,
     Double,
+    Construct,
+    Container,
+    HexDisplayedBytes,
+    HexDisplayedInteger,
+    ConstError,
+    BitwisableString,
+    stream_read,
+    evaluate,
+    RangeError,
+    ListContainer,
+    Renamed,
+    FormatField,
+    StopFieldError,
+    Pass,
 )
 
 import logger
 
 # ------------------------------------------------------------------------------
 
+# Maximum number of blobs handed to a worker process per task, see
+# tblob.parse_blobs.
+WORKER_CHUNK_SIZE = 512
+
+# TL boolean signatures and their values, see tblob.tbool_struct.
+TBOOL_VALUES = {0xBC799737: "false", 0x997275B5: "true"}
+
+# ------------------------------------------------------------------------------
+
+# Short strings (user names, titles, mime types, emoji...) repeat a lot across
+# blobs: they are decoded once and then shared. Past TSTRING_INTERN_MAX_SIZE
+# of them, the oldest one is dropped for each new one.
+TSTRING_INTERN_MAX_LEN = 64
+TSTRING_INTERN_MAX_SIZE = 1 << 16
+_tstrings = {}
+
 
 def decode_tstring(binarray):
-    try:
-        str_utf = binarray.decode("utf-8")
-    except UnicodeDecodeError:
-        logger.error("unable to decode string: %s", binarray)
-        str_utf = binarray
+    str_utf = _tstrings.get(binarray)
+    if str_utf is not None:
+        return str_utf
+    if binarray.isascii():
+        str_utf = binarray.decode("ascii")
+    else:
+        try:
+            str_utf = binarray.decode("utf-8")
+        except UnicodeDecodeError:
+            logger.error("unable to decode string: %s", binarray)
+            return binarray
+    if len(binarray) < TSTRING_INTERN_MAX_LEN:
+        if len(_tstrings) >= TSTRING_INTERN_MAX_SIZE:
+            del _tstrings[next(iter(_tstrings))]
+        _tstrings[binarray] = str_utf
     return str_utf
 
 
+# Blobs of the same chats share many dates, down to the second.
+@functools.lru_cache(maxsize=1 << 16)
+def epoch_to_iso(epoch):
+    return datetime.datetime.utcfromtimestamp(epoch).isoformat()
+
+
+def read_tbytes(stream, path, value_name):
+    """Reads a TL string/bytes field, returns its first byte, its length
+    prefix, its length, its value and the number of padding bytes following
+    it, which are left to the caller. Read errors carry the path of the field
+    being read, as with the Struct fields, value_name being the value's."""
+    check = stream_read(stream, 1, path + " -> _pl")[0]
+    if check >= 254:
+        prefix = check | int.from_bytes(stream_read(stream, 3, path + " -> _pl"), "little") << 8
+        length = prefix >> 8
+    else:
+        prefix = length = check
+    # The field, header included, is padded to 4 bytes: a 4 bytes header does
+    # not change the padding, a 1 byte header counts as 1.
+    padding = -(length + (check < 254)) & 3
+    return check, prefix, length, stream_read(stream, length, path + " -> " + value_name), padding
+
+
+# Container(**kwargs) and Container attribute access run Python code, item
+# access does not: the construct classes below build their Containers item by
+# item, with the same keys in the same order as construct does.
+def struct_context(context, subcons, stream):
+    """Returns the context of a Struct parse, as Struct._parse builds it."""
+    struct_ctx = Container()
+    struct_ctx["_"] = context
+    struct_ctx["_params"] = context["_params"]
+    struct_ctx["_root"] = None
+    struct_ctx["_parsing"] = context["_parsing"]
+    struct_ctx["_building"] = context["_building"]
+    struct_ctx["_sizing"] = context["_sizing"]
+    struct_ctx["_subcons"] = subcons
+    struct_ctx["_io"] = stream
+    struct_ctx["_index"] = context.get("_index", None)
+    struct_ctx["_root"] = context.get("_root", struct_ctx)
+    return struct_ctx
+
+
+class TStringStruct(Construct):
+    """TL string, parsed into the same Container as the Struct built out of
+    Peek, IfThenElse and Padding fields it replaces, in a single call."""
+
+    def _parse(self, stream, context, path):
+        check, prefix, length, value, padding = read_tbytes(stream, path, "_value")
+        obj = Container()
+        obj["_io"] = stream
+        obj["_sname"] = "tstring"
+        obj["_check"] = check
+        obj["_pl"] = prefix
+        obj["_len"] = length
+        obj["_value"] = value
+        obj["string"] = decode_tstring(value)
+        if padding:
+            stream_read(stream, padding, path)
+        return obj
+
+
+class TBytesStruct(Construct):
+    """TL bytes, see TStringStruct."""
+
+    def _parse(self, stream, context, path):
+        check, prefix, length, value, padding = read_tbytes(stream, path, "bytes")
+        if padding:
+            stream_read(stream, padding, path)
+        obj = Container()
+        obj["_io"] = stream
+        obj["_sname"] = "tbytes"
+        obj["_check"] = check
+        obj["_pl"] = prefix
+        obj["len"] = length
+        obj["bytes"] = HexDisplayedBytes(value)
+        return obj
+
+
+class TSignature(Construct):
+    """TL object signature, equivalent to Hex(Const(signature, Int32ul)) but
+    checked with a single bytes comparison. The parsed value is shared."""
+
+    def __init__(self, signature):
+        super().__init__()
+        self.signature = signature
+        self._signature_bytes = signature.to_bytes(4, "little")
+        self._value = HexDisplayedInteger.new(signature, "08X")
+
+    def _parse(self, stream, context, path):
+        data = stream_read(stream, 4, path)
+        if data != self._signature_bytes:
+            raise ConstError(
+                "parsing expected {!r} but parsed {!r}".format(
+                    self.signature, int.from_bytes(data, "little")
+                ),
+                path=path,
+            )
+        return self._value
+
+
+class TPeekSignature(Construct):
+    """Peek(Int32ul) of the signature of the next TL object: it reads the 4
+    bytes and seeks back, returning None when they are not available."""
+
+    def _parse(self, stream, context, path):
+        fallback = stream.tell()
+        data = stream.read(4)
+        stream.seek(fallback)
+        if len(data) != 4:
+            return None
+        return int.from_bytes(data, "little")
+
+
+class TFlags(FlagsEnum):
+    """FlagsEnum(Int32ul, **flags) parsed into the same Container, with the
+    flag names and masks prepared once."""
+
+    def __init__(self, **flags):
+        super().__init__(Int32ul, **flags)
+        self._masks = tuple((BitwisableString(name), mask) for name, mask in flags.items())
+
+    def _parse(self, stream, context, path):
+        return self._container(int.from_bytes(stream_read(stream, 4, path), "little"))
+
+    def _container(self, value):
+        """Returns the flags Container of the 32 bits value."""
+        obj = Container()
+        obj["_flagsenum"] = True
+        for name, mask in self._masks:
+            obj[name] = value & mask == mask
+        return obj
+
+
+class TStruct(Struct):
+    """Struct parsed into the same Container, with the named fields parsed
+    without going through Renamed, the constant Computed fields (e.g. sname)
+    stored directly and each run of consecutive little endian integer or
+    TFlags fields (e.g. id and access_hash, a vector signature and its items
+    count, or flags and the fields after them), optionally led by a
+    TSignature, read by a single unpack."""
+
+    def __init__(self, *subcons, **subconskw):
+        super().__init__(*subcons, **subconskw)
+        # Steps are (name, subcon, path suffix), (name, None, value) for a
+        # constant or, for a run, (None, None, (signature, unpack, size,
+        # fields, flags)), the fields being (name, subcon, path suffix) of the
+        # run fields and flags, if the run has TFlags fields, the TFlags of
+        # each unpacked value or None.
+        self._steps = []
+        run = []
+        for subcon in self.subcons + [None]:
+            field = None
+            if isinstance(subcon, Renamed) and subcon.name and subcon.parsed is None:
+                if isinstance(subcon.subcon, Computed) and not callable(subcon.subcon.func):
+                    field = (subcon.name, None, subcon.subcon.func)
+                else:
+                    field = (subcon.name, subcon.subcon, " -> " + subcon.name)
+                if self.__is_run_integer(subcon.subcon):
+                    run.append(field)
+                    continue
+            if len(run) > 1:
+                self._steps.append((None, None, self.__build_run(run)))
+            else:
+                self._steps.extend(run)
+            run = []
+            if subcon is None:
+                break
+            if field is None:
+                self._steps.append((subcon.name, subcon, ""))
+            elif isinstance(field[1], TSignature):
+                run.append(field)
+            else:
+                self._steps.append(field)
+
+    @staticmethod
+    def __is_run_integer(subcon):
+        if isinstance(subcon, TFlags):
+            return True
+        return (
+            isinstance(subcon, FormatField)
+            and subcon.fmtstr[0] == "<"
+            and subcon.fmtstr[1] in "BbHhIiLlQq"
+            and subcon.parsed is None
+        )
+
+    @staticmethod
+    def __build_run(run):
+        if isinstance(run[0][1], TSignature):
+            signature = run[0][1]
+            run_format = "<4x"
+        else:
+            signature = None
+            run_format = "<"
+        start = 1 if signature is not None else 0
+        flags = tuple(
+            subcon if isinstance(subcon, TFlags) else None for _, subcon, _ in run[start:]
+        )
+        run_format += "".join(
+            "I" if subcon is not None else field_subcon.fmtstr[1:]
+            for subcon, (_, field_subcon, _) in zip(flags, run[start:])
+        )
+        run_struct = struct.Struct(run_format)
+        if not any(flags):
+            flags = None
+        return (signature, run_struct.unpack, run_struct.size, tuple(run), flags)
+
+    def _parse(self, stream, context, path):
+        obj = Container()
+        obj["_io"] = stream
+        context = struct_context(context, self._subcons, stream)
+        for name, subcon, extra in self._steps:
+            try:
+                if subcon is not None:
+                    subobj = subcon._parsereport(stream, context, path + extra)
+                    if name:
+                        obj[name] = subobj
+                        context[name] = subobj
+                    continue
+                if name is not None:
+                    obj[name] = context[name] = extra
+                    continue
+                signature, unpack, size, fields, flags = extra
+                fallback = stream.tell()
+                data = stream.read(size)
+                if len(data) == size and (
+                    signature is None or data[:4] == signature._signature_bytes
+                ):
+                    if signature is not None:
+                        name = fields[0][0]
+                        obj[name] = context[name] = signature._value
+                        fields = fields[1:]
+                    values = unpack(data)
+                    if flags is not None:
+                        values = [
+                            value if subcon is None else subcon._container(value)
+                            for subcon, value in zip(flags, values)
+                        ]
+                    for (name, _, _), value in zip(fields, values):
+                        obj[name] = context[name] = value
+                    continue
+                # Short data or wrong signature: the fields are parsed one by
+                # one again to fail exactly where and as Struct does.
+                stream.seek(fallback)
+                for name, field, suffix in fields:
+                    subobj = field._parsereport(stream, context, path + suffix)
+                    obj[name] = context[name] = subobj
+            except StopFieldError:
+                break
+        return obj
+
+
+class TSignatureStruct(Struct):
+    """Struct("sname" / Computed(sname), "signature" / TSignature(signature))
+    of the TL objects without fields, parsed into the same Container without
+    a Struct context."""
+
+    def __init__(self, sname, signature):
+        super().__init__("sname" / Computed(sname), "signature" / TSignature(signature))
+        self._sname = sname
+        self._signature = self.subcons[1].subcon
+
+    def _parse(self, stream, context, path):
+        signature = self._signature._parse(stream, context, path + " -> signature")
+        obj = Container()
+        obj["_io"] = stream
+        obj["sname"] = self._sname
+        obj["signature"] = signature
+        return obj
+
+
+class TSignatureSwitch(Struct):
+    """Struct("_signature" / Peek(Int32ul), name / Switch(this._signature,
+    tag_map)) parsed into the same Container, the peeked signature indexing
+    the tag map directly instead of going through Switch."""
+
+    def __init__(self, name, tag_map):
+        super().__init__("_signature" / TPeekSignature(), name / Switch(this._signature, tag_map))
+        self._peek = self.subcons[0].subcon
+        self._name = name
+        self._name_path = " -> " + name
+        self._tag_map = tag_map
+
+    def _parse(self, stream, context, path):
+        signature = self._peek._parse(stream, context, path)
+        obj = Container()
+        obj["_io"] = stream
+        obj["_signature"] = signature
+        context = struct_context(context, self._subcons, stream)
+        context["_signature"] = signature
+        subcon = self._tag_map.get(signature)
+        if subcon is None:
+            subobj = None
+        else:
+            subobj = subcon._parsereport(stream, context, path + self._name_path)
+        obj[self._name] = subobj
+        context[self._name] = subobj
+        return obj
+
+
+class TFlagIf(IfThenElse):
+    """If(this.flags.<flag>, subcon), with the flag looked up directly in the
+    flags Container parsed by the enclosing struct."""
+
+    def __init__(self, flag, subcon):
+        super().__init__(this.flags[flag], subcon, Pass)
+        self._flag = flag
+
+    def _parse(self, stream, context, path):
+        if context["flags"][self._flag]:
+            return self.thensubcon._parsereport(stream, context, path)
+        return None
+
+
+class TArray(Array):
+    """Array(count, subcon) parsed into the same ListContainer, the context
+    _index being set by item instead of attribute."""
+
+    def _parse(self, stream, context, path):
+        count = evaluate(self.count, context)
+        if not 0 <= count:
+            raise RangeError("invalid count %s" % (count,), path=path)
+        parse = self.subcon._parsereport
+        obj = ListContainer()
+        for index in range(count):
+            context["_index"] = index
+            obj.append(parse(stream, context, path))
+        return obj
+
+
+class TIntArray(Array):
+    """Array(count, Int32ul) or Array(count, Int64ul), parsed into the same
+    ListContainer reading and decoding all the items at once."""
+
+    TYPECODES = {Int32ul: "I", Int64ul: "Q"}
+
+    def __init__(self, count, subcon):
+        super().__init__(count, subcon)
+        self._typecode = self.TYPECODES[subcon]
+        self._itemsize = subcon.sizeof()
+
+    def _parse(self, stream, context, path):
+        count = evaluate(self.count, context)
+        if not 0 <= count:
+            raise RangeError("invalid count %s" % (count,), path=path)
+        fallback = stream.tell()
+        data = stream.read(count * self._itemsize)
+        if len(data) != count * self._itemsize:
+            # Short data: the items are parsed one by one again to fail
+            # exactly where and as Array does.
+            stream.seek(fallback)
+            return super()._parse(stream, context, path)
+        items = array.array(self._typecode, data)
+        assert items.itemsize == self._itemsize
+        if sys.byteorder == "big":
+            items.byteswap()
+        return ListContainer(items.tolist())
+
+
+def cached_struct(builder):
+    """Decorates a tblob struct builder method: the struct is built once per
+    tblob instance and arguments, then shared by every parse needing it,
+    LazyBound included."""
+
+    @functools.wraps(builder)
+    def cached_builder(self, *args):
+        key = (builder, args)
+        built = self._structs.get(key)
+        if built is None:
+            built = builder(self, *args)
+            self._structs[key] = built
+        return built
+
+    return cached_builder
+
+
 # ------------------------------------------------------------------------------
 
 
@@ -77,59 +496,47 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
-    tstring_struct = Struct(
-        "_sname" / Computed("tstring"),
-        "_check" / Peek(Byte),
-        "_pl" / IfThenElse(this._check >= 254, Int32ul, Byte),
-        "_len" / IfThenElse(this._check >= 254, Computed(this._pl >> 8), Computed(this._pl)),
-        # 'value' / PaddedString(this._len, 'utf-8'),
-        "_value" / Bytes(this._len),
-        "string" / Computed(lambda x: decode_tstring(x._value)),
-        IfThenElse(
-            this._check >= 254,
-            If(this._len % 4, Padding(4 - this._len % 4)),
-            If((this._len + 1) % 4, Padding(4 - (this._len + 1) % 4)),
-        ),
-    )
+    tstring_struct = TStringStruct()
 
-    tbytes_struct = Struct(
-        "_sname" / Computed("tbytes"),
-        "_check" / Peek(Byte),
-        "_pl" / IfThenElse(this._check >= 254, Int32ul, Byte),
-        "len" / IfThenElse(this._check >= 254, Computed(this._pl >> 8), Computed(this._pl)),
-        # 'bytes' / Array(this.len, Byte),
-        "bytes" / Hex(Bytes(this.len)),
-        IfThenElse(
-            this._check >= 254,
-            If(this.len % 4, Padding(4 - this.len % 4)),
-            If((this.len + 1) % 4, Padding(4 - (this.len + 1) % 4)),
-        ),
-    )
+    tbytes_struct = TBytesStruct()
+
+    # Signature of the TL vectors, followed by their items count.
+    tvector_signature = TSignature(0x1CB5C415)
 
     tbool_struct = Struct(
         "sname" / Computed("boolean"),
         "_signature" / Int32ul,
-        "value"
-        / IfThenElse(
-            this._signature == 0xBC799737,
-            Computed("false"),
-            IfThenElse(this._signature == 0x997275B5, Computed("true"), Computed("ERROR")),
-        ),
+        "value" / Computed(lambda this: TBOOL_VALUES.get(this._signature, "ERROR")),
     )
 
     # This is not struct define by Telegram, but it's useful to get human
     # readable timestamps.
-    ttimestamp_struct = Struct(
+    ttimestamp_struct = TStruct(
         "epoch" / Int32ul,
-        "date" / Computed(lambda this: datetime.datetime.utcfromtimestamp(this.epoch).isoformat()),
+        "date" / Computed(lambda this: epoch_to_iso(this.epoch)),
     )
 
     # --------------------------------------------------------------------------
 
-    def __init__(self):
+    def __init__(self, workers=1):
         setGlobalPrintFullStrings(True)
         setGlobalPrintPrivateEntries(False)
         self._callbacks = {}
+        # Parsers built so far and their object names, by signature: a blob
+        # parser is built once and then reused for every blob with the same
+        # signature, with a single lookup.
+        self._parsers = {}
+        self._names = {}
+        # Signatures whose parser ends with an UNPARSED field.
+        self._unparsed_signatures = set()
+        # Signatures of the supported blobs, see scan_signatures.
+        self._signatures = None
+        # Structs built so far, see cached_struct.
+        self._structs = {}
+        # Blobs passed to parse_blobs are parsed by a pool of worker processes,
+        # started on first use, when more than one worker is requested.
+        self._workers = workers
+        self._pool = None
         logger.debug("building callbacks ...")
         for signature, blob_tuple in tblob.tdss_callbacks.items():
             logger.debug("adding callback %s (%s)", hex(signature), blob_tuple[1])
@@ -143,62 +550,137 @@ class tblob:  # pylint: disable=C0103
         assert self._callbacks
         return self._callbacks
 
+    @property
+    def workers(self):
+        return self._workers
+
+    # --------------------------------------------------------------------------
+
+    def parse_blobs(self, blobs):
+        """Parses a list of blobs (bytes), returning an iterator over the
+        parsed blobs. The parsing is spread across the worker processes, if
+        any, and parsed blobs are yielded as soon as they are available."""
+        if self._workers <= 1:
+            return map(self.parse_blob, blobs)
+        if self._pool is None:
+            # Spawned workers do not inherit the parent state, logging
+            # included, so that they behave the same on every platform.
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                self._workers,
+                multiprocessing.get_context("spawn"),
+                _init_worker,
+                (logger.get_level(),),
+            )
+        # Large tasks amortize the inter process traffic, while keeping a few
+        # tasks per worker to balance the load.
+        chunksize = max(1, min(WORKER_CHUNK_SIZE, len(blobs) // (4 * self._workers)))
+        return self._pool.map(_parse_blob_worker, blobs, chunksize=chunksize)
+
+    def close(self):
+        """Stops the worker processes, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
     # --------------------------------------------------------------------------
 
     def parse_blob(self, data):
-        pblob = None
+        """Parses data, bytes or a seekable stream supporting len() and
+        slicing such as sqlite3.Blob, which is parsed in place."""
         signature = int.from_bytes(data[:4], "little")
-        if signature in self.callbacks:
-            blob_parser, name, beautify = self.callbacks[signature]
-            if blob_parser:
-                pblob = blob_parser(self).parse(data)
-                # Some structures has the 'UNPARSED' field to get the remaining
-                # bytes. It's expected to get some of these cases (e.g. wrong
-                # flags, it happens...) and I want everything to be in front of
-                # the analyst. So, if UNPARSED has a length > 0, a warning
-                # message is raised, but the missing data is in the blob.
-                unparsed = getattr(pblob, "UNPARSED", None)
-                if unparsed:
-                    unparsed_len = len(pblob.UNPARSED)
-                    if unparsed_len:
-                        logger.warning(
-                            "Object: %s [0x%x] contains unparsed "
-                            "data [%d bytes], see UNPARSED field",
-                            name,
-                            signature,
-                            unparsed_len,
-                        )
-                data_len = len(data)
-                # In case the object has not (yet) the UNPARSED field, the next
-                # check will raise and error and report the missed data. Note
-                # that the missed data will be not reported in the blob.
-                object_len = pblob._io.tell()
-                if data_len != object_len:
-                    logger.error(
-                        "Not all data parsed for object: %s [0x%x], "
-                        "input: %d, parsed: %d, missed: %s",
-                        name,
-                        signature,
-                        data_len,
-                        object_len,
-                        data[object_len:],
-                    )
-                if beautify:
-                    pass  # [TBR] Actually not implemented.
-            else:
-                logger.warning("blob '%s' [%s] not supported", name, hex(signature))
+        parser = self._parsers.get(signature)
+        if parser is None:
+            parser = self.__build_parser(signature)
+            if parser is None:
+                return None
+        if hasattr(data, "read"):
+            pblob = parser.parse_stream(data)
         else:
-            logger.error("unknown signature %s", hex(signature))
+            pblob = parser.parse(data)
+        # Some structures has the 'UNPARSED' field to get the remaining
+        # bytes. It's expected to get some of these cases (e.g. wrong
+        # flags, it happens...) and I want everything to be in front of
+        # the analyst. So, if UNPARSED has a length > 0, a warning
+        # message is raised, but the missing data is in the blob.
+        if signature in self._unparsed_signatures:
+            unparsed_len = len(pblob.UNPARSED)
+            if unparsed_len:
+                logger.warning(
+                    "Object: %s [0x%x] contains unparsed "
+                    "data [%d bytes], see UNPARSED field",
+                    self._names[signature],
+                    signature,
+                    unparsed_len,
+                )
+        data_len = len(data)
+        # In case the object has not (yet) the UNPARSED field, the next
+        # check will raise and error and report the missed data. Note
+        # that the missed data will be not reported in the blob.
+        object_len = pblob._io.tell()
+        if data_len != object_len:
+            logger.error(
+                "Not all data parsed for object: %s [0x%x], "
+                "input: %d, parsed: %d, missed: %s",
+                self._names[signature],
+                signature,
+                data_len,
+                object_len,
+                data[object_len:],
+            )
         return pblob
 
+    def __build_parser(self, signature):
+        """Builds the parser of the blobs with signature, None if the
+        signature is unknown or its blobs are not supported."""
+        if signature not in self.callbacks:
+            logger.error("unknown signature %s", hex(signature))
+            return None
+        blob_parser, name, beautify = self.callbacks[signature]
+        if not blob_parser:
+            logger.warning("blob '%s' [%s] not supported", name, hex(signature))
+            return None
+        if beautify:
+            pass  # [TBR] Actually not implemented.
+        parser = blob_parser(self)
+        self._parsers[signature] = parser
+        self._names[signature] = name
+        if any(subcon.name == "UNPARSED" for subcon in getattr(parser, "subcons", ())):
+            self._unparsed_signatures.add(signature)
+        return parser
+
+    def scan_signatures(self, data):
+        """Scans raw data (e.g. a database page) for the signatures of the
+        supported blobs, returns the sorted list of (offset, signature)."""
+        if self._signatures is None:
+            self._signatures = frozenset(
+                signature for signature, blob_tuple in self.callbacks.items() if blob_tuple[0]
+            )
+        found = []
+        # Data is read as 32 bits words once per possible alignment, the
+        # words are then checked against the signatures set in one pass.
+        for shift in range(4):
+            end = shift + (len(data) - shift) // 4 * 4
+            words = array.array("I", data[shift:end])
+            assert words.itemsize == 4
+            if sys.byteorder == "big":
+                words.byteswap()
+            found.extend(
+                (shift + 4 * index, word)
+                for index, word in enumerate(words)
+                if word in self._signatures
+            )
+        found.sort()
+        return found
+
     # --------------------------------------------------------------------------
     # TDSs implementation
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def audio_old2_struct(self):
         return Struct(
             "sname" / Computed("audio_old2"),
-            "signature" / Hex(Const(0xC7AC6496, Int32ul)),
+            "signature" / TSignature(0xC7AC6496),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "user_id" / Int32ul,
@@ -209,10 +691,11 @@ class tblob:  # pylint: disable=C0103
             "dc_id" / Int32ul,
         )
 
+    @cached_struct
     def audio_layer45_struct(self):
         return Struct(
             "sname" / Computed("audio_layer45"),
-            "signature" / Hex(Const(0xF9E35055, Int32ul)),
+            "signature" / TSignature(0xF9E35055),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -222,10 +705,11 @@ class tblob:  # pylint: disable=C0103
             "dc_id" / Int32ul,
         )
 
+    @cached_struct
     def audio_old_struct(self):
         return Struct(
             "sname" / Computed("audio_old"),
-            "signature" / Hex(Const(0x427425E7, Int32ul)),
+            "signature" / TSignature(0x427425E7),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "user_id" / Int32ul,
@@ -235,10 +719,11 @@ class tblob:  # pylint: disable=C0103
             "dc_id" / Int32ul,
         )
 
+    @cached_struct
     def audio_encrypted_struct(self):
         return Struct(
             "sname" / Computed("audio_encrypted"),
-            "signature" / Hex(Const(0x555555F6, Int32ul)),
+            "signature" / TSignature(0x555555F6),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "user_id" / Int32ul,
@@ -250,20 +735,22 @@ class tblob:  # pylint: disable=C0103
             "iv" / self.tbytes_struct,
         )
 
+    @cached_struct
     def audio_empty_layer45_struct(self):
         return Struct(
             "sname" / Computed("audio_empty_layer45"),
-            "signature" / Hex(Const(0x586988D8, Int32ul)),
+            "signature" / TSignature(0x586988D8),
             "id" / Int64ul,
         )
 
+    @cached_struct
     def audio_structures(self, name):
         tag_map = {
-            0xC7AC6496: LazyBound(lambda: self.audio_old2_struct()),
-            0xF9E35055: LazyBound(lambda: self.audio_layer45_struct()),
-            0x427425E7: LazyBound(lambda: self.audio_old_struct()),
-            0x555555F6: LazyBound(lambda: self.audio_encrypted_struct()),
-            0x586988D8: LazyBound(lambda: self.audio_empty_layer45_struct()),
+            0xC7AC6496: self.audio_old2_struct(),
+            0xF9E35055: self.audio_layer45_struct(),
+            0x427425E7: self.audio_old_struct(),
+            0x555555F6: self.audio_encrypted_struct(),
+            0x586988D8: self.audio_empty_layer45_struct(),
         }
         return "audio_structures" / Struct(
             "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
@@ -271,53 +758,60 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def bot_command_struct(self):
         return Struct(
             "sname" / Computed("bot_command"),
-            "signature" / Hex(Const(0xC27AC8C7, Int32ul)),
+            "signature" / TSignature(0xC27AC8C7),
             "command" / self.tstring_struct,
             "description" / self.tstring_struct,
         )
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def base_theme_night_struct(self):
         return Struct(
             "sname" / Computed("base_theme_night"),
-            "signature" / Hex(Const(0xB7B31EA8, Int32ul)),
+            "signature" / TSignature(0xB7B31EA8),
         )
 
+    @cached_struct
     def base_theme_classic_struct(self):
         return Struct(
             "sname" / Computed("base_theme_classic"),
-            "signature" / Hex(Const(0xC3A12462, Int32ul)),
+            "signature" / TSignature(0xC3A12462),
         )
 
+    @cached_struct
     def base_theme_day_struct(self):
         return Struct(
             "sname" / Computed("base_theme_day"),
-            "signature" / Hex(Const(0xFBD81688, Int32ul)),
+            "signature" / TSignature(0xFBD81688),
         )
 
+    @cached_struct
     def base_theme_arctic_struct(self):
         return Struct(
             "sname" / Computed("base_theme_arctic"),
-            "signature" / Hex(Const(0x5B11125A, Int32ul)),
+            "signature" / TSignature(0x5B11125A),
         )
 
+    @cached_struct
     def base_theme_tinted_struct(self):
         return Struct(
             "sname" / Computed("base_theme_tinted"),
-            "signature" / Hex(Const(0x6D5F77EE, Int32ul)),
+            "signature" / TSignature(0x6D5F77EE),
         )
 
+    @cached_struct
     def base_theme_structures(self, name):
         tag_map = {
-            0xB7B31EA8: LazyBound(lambda: self.base_theme_night_struct()),
-            0xC3A12462: LazyBound(lambda: self.base_theme_classic_struct()),
-            0xFBD81688: LazyBound(lambda: self.base_theme_day_struct()),
-            0x5B11125A: LazyBound(lambda: self.base_theme_arctic_struct()),
-            0x6D5F77EE: LazyBound(lambda: self.base_theme_tinted_struct()),
+            0xB7B31EA8: self.base_theme_night_struct(),
+            0xC3A12462: self.base_theme_classic_struct(),
+            0xFBD81688: self.base_theme_day_struct(),
+            0x5B11125A: self.base_theme_arctic_struct(),
+            0x6D5F77EE: self.base_theme_tinted_struct(),
         }
         return "base_theme_structures" / Struct(
             "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
@@ -325,10 +819,11 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def bot_info_struct(self):
         return Struct(
             "sname" / Computed("bot_info"),
-            "signature" / Hex(Const(0x98E81D3A, Int32ul)),
+            "signature" / TSignature(0x98E81D3A),
             "user_id" / Int32ul,
             "description" / self.tstring_struct,
             "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
@@ -336,10 +831,11 @@ class tblob:  # pylint: disable=C0103
             "bot_commands_array" / Array(this.bot_commands_num, self.bot_command_struct()),
         )
 
+    @cached_struct
     def bot_info_layer48_struct(self):
         return Struct(
             "sname" / Computed("bot_info_layer48"),
-            "signature" / Hex(Const(0x09CF585D, Int32ul)),
+            "signature" / TSignature(0x09CF585D),
             "user_id" / Int32ul,
             "version" / Int32ul,
             "unknown" / self.tstring_struct,
@@ -349,17 +845,19 @@ class tblob:  # pylint: disable=C0103
             "bot_commands_array" / Array(this.bot_commands_num, self.bot_command_struct()),
         )
 
+    @cached_struct
     def bot_info_empty_layer48_struct(self):
         return Struct(
             "sname" / Computed("bot_info_empty_layer48"),
-            "signature" / Hex(Const(0xBB2E37CE, Int32ul)),
+            "signature" / TSignature(0xBB2E37CE),
         )
 
+    @cached_struct
     def bot_info_structures(self, name):
         tag_map = {
-            0x98E81D3A: LazyBound(lambda: self.bot_info_struct()),
-            0xBB2E37CE: LazyBound(lambda: self.bot_info_empty_layer48_struct()),
-            0x09CF585D: LazyBound(lambda: self.bot_info_layer48_struct()),
+            0x98E81D3A: self.bot_info_struct(),
+            0xBB2E37CE: self.bot_info_empty_layer48_struct(),
+            0x09CF585D: self.bot_info_layer48_struct(),
         }
         return "bot_info_structures" / Struct(
             "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
@@ -367,13 +865,13 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def channel_admin_rights_layer92_struct(self):
         return Struct(
             "sname" / Computed("channel_admin_rights_layer92"),
-            "signature" / Hex(Const(0x5D7CEBA5, Int32ul)),
+            "signature" / TSignature(0x5D7CEBA5),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 change_info=1,
                 post_messages=2,
                 edit_messages=4,
@@ -386,13 +884,13 @@ class tblob:  # pylint: disable=C0103
             ),
         )
 
+    @cached_struct
     def channel_banned_rights_layer92_struct(self):
         return Struct(
             "sname" / Computed("channel_banned_rights_layer92"),
-            "signature" / Hex(Const(0x58CF4249, Int32ul)),
+            "signature" / TSignature(0x58CF4249),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 view_messages=1,
                 send_messages=2,
                 send_media=4,
@@ -405,13 +903,13 @@ class tblob:  # pylint: disable=C0103
             "until_timestamp" / Int32ul,
         )
 
+    @cached_struct
     def chat_admin_rights_struct(self):
         return Struct(
             "sname" / Computed("chat_admin_rights"),
-            "signature" / Hex(Const(0x5FB224D5, Int32ul)),
+            "signature" / TSignature(0x5FB224D5),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 change_info=1,
                 post_messages=2,
                 edit_messages=4,
@@ -423,13 +921,13 @@ class tblob:  # pylint: disable=C0103
             ),
         )
 
+    @cached_struct
     def chat_banned_rights_struct(self):
         return Struct(
             "sname" / Computed("chat_banned_rights"),
-            "signature" / Hex(Const(0x9F120418, Int32ul)),
+            "signature" / TSignature(0x9F120418),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 view_messages=1,
                 send_messages=2,
                 send_media=4,
@@ -448,51 +946,88 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def chat_empty_struct(self):
         return Struct(
             "sname" / Computed("chat_empty"),
-            "signature" / Hex(Const(0x9BA2D800, Int32ul)),
+            "signature" / TSignature(0x9BA2D800),
             "id" / Int32ul,
             "title" / Computed("DELETED"),
         )
 
+    @cached_struct
     def channel_forbidden_struct(self):
         return Struct(
             "sname" / Computed("channel_forbidden"),
-            "signature" / Hex(Const(0x289DA732, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, broadcast=32, megagroup=256, has_expiration=65536),
+            "signature" / TSignature(0x289DA732),
+            "flags" / TFlags(broadcast=32, megagroup=256, has_expiration=65536),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "title" / self.tstring_struct,
             "util_timestamp" / If(this.flags.has_expiration, Int32ul),
         )
 
+    @cached_struct
     def channel_forbidden_layer52_struct(self):
         return Struct(
             "sname" / Computed("channel_forbidden_layer52"),
-            "signature" / Hex(Const(0x2D85832C, Int32ul)),
+            "signature" / TSignature(0x2D85832C),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "title" / self.tstring_struct,
         )
 
+    @cached_struct
     def channel_forbidden_layer67_struct(self):
         return Struct(
             "sname" / Computed("channel_forbidden_layer67"),
-            "signature" / Hex(Const(0x8537784F, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, broadcast=32, megagroup=256),
+            "signature" / TSignature(0x8537784F),
+            "flags" / TFlags(broadcast=32, megagroup=256),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "title" / self.tstring_struct,
         )
 
+    def channel_layer_struct(
+        self, name, signature, flags, photo=True, rights_structs=None, participants_count=False
+    ):
+        """Builds the channel_layer* structs, which only differ by their flags,
+        the presence of the photo and participants_count fields and the
+        version of the admin/banned rights structs (rights_structs)."""
+        fields = [
+            "sname" / Computed(name),
+            "signature" / TSignature(signature),
+            "flags" / TFlags(**flags),
+            "id" / Int32ul,
+            "access_hash" / If(this.flags.has_access_hash, Int64ul),
+            "title" / self.tstring_struct,
+            "username" / If(this.flags.has_username, self.tstring_struct),
+        ]
+        if photo:
+            fields.append("photo" / self.chat_photo_structures("photo"))
+        fields += [
+            "date" / self.ttimestamp_struct,
+            "version" / Int32ul,
+            "restrict_reason" / If(this.flags.restricted, self.tstring_struct),
+        ]
+        if rights_structs:
+            admin_rights_struct, banned_rights_struct = rights_structs
+            fields += [
+                "admin_rights" / If(this.flags.has_admin_rights, admin_rights_struct),
+                "banned_rights" / If(this.flags.has_banned_rights, banned_rights_struct),
+            ]
+        if participants_count:
+            fields.append(
+                "participants_count" / If(this.flags.has_participant_count, Int32ul)
+            )
+        return Struct(*fields)
+
+    @cached_struct
     def channel_layer104_struct(self):
-        return Struct(
-            "sname" / Computed("channel_layer104"),
-            "signature" / Hex(Const(0x4DF30834, Int32ul)),
-            "flags"
-            / FlagsEnum(
-                Int32ul,
+        return self.channel_layer_struct(
+            "channel_layer104",
+            0x4DF30834,
+            dict(
                 creator=1,
                 left=4,
                 broadcast=32,
@@ -508,26 +1043,17 @@ class tblob:  # pylint: disable=C0103
                 has_access_hash=8192,
                 scam=524288,
             ),
-            "id" / Int32ul,
-            "access_hash" / If(this.flags.has_access_hash, Int64ul),
-            "title" / self.tstring_struct,
-            "username" / If(this.flags.has_username, self.tstring_struct),
-            "photo" / self.chat_photo_structures("photo"),
-            "date" / self.ttimestamp_struct,
-            "version" / Int32ul,
-            "restrict_reason" / If(this.flags.restricted, self.tstring_struct),
-            "admin_rights" / If(this.flags.has_admin_rights, self.chat_admin_rights_struct()),
-            "banned_rights" / If(this.flags.has_banned_rights, self.chat_banned_rights_struct()),
-            "participants_count" / If(this.flags.has_participant_count, Int32ul),
+            rights_structs=(self.chat_admin_rights_struct(), self.chat_banned_rights_struct()),
+            participants_count=True,
         )
 
+    @cached_struct
     def channel_old_struct(self):
         return Struct(
             "sname" / Computed("channel_old"),
-            "signature" / Hex(Const(0x678E9587, Int32ul)),
+            "signature" / TSignature(0x678E9587),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 creator=1,
                 kicked=2,
                 left=4,
@@ -547,13 +1073,12 @@ class tblob:  # pylint: disable=C0103
             "version" / Int32ul,
         )
 
+    @cached_struct
     def channel_layer48_struct(self):
-        return Struct(
-            "sname" / Computed("channel_layer48"),
-            "signature" / Hex(Const(0x4B1B7506, Int32ul)),
-            "flags"
-            / FlagsEnum(
-                Int32ul,
+        return self.channel_layer_struct(
+            "channel_layer48",
+            0x4B1B7506,
+            dict(
                 creator=1,
                 kicked=2,
                 left=4,
@@ -567,23 +1092,14 @@ class tblob:  # pylint: disable=C0103
                 is_min=4096,
                 has_access_hash=8192,
             ),
-            "id" / Int32ul,
-            "access_hash" / If(this.flags.has_access_hash, Int64ul),
-            "title" / self.tstring_struct,
-            "username" / If(this.flags.has_username, self.tstring_struct),
-            "photo" / self.chat_photo_structures("photo"),
-            "date" / self.ttimestamp_struct,
-            "version" / Int32ul,
-            "restrict_reason" / If(this.flags.restricted, self.tstring_struct),
         )
 
+    @cached_struct
     def channel_layer67_struct(self):
-        return Struct(
-            "sname" / Computed("channel_layer67"),
-            "signature" / Hex(Const(0xA14DCA52, Int32ul)),
-            "flags"
-            / FlagsEnum(
-                Int32ul,
+        return self.channel_layer_struct(
+            "channel_layer67",
+            0xA14DCA52,
+            dict(
                 creator=1,
                 kicked=2,
                 left=4,
@@ -597,23 +1113,14 @@ class tblob:  # pylint: disable=C0103
                 is_min=4096,
                 has_access_hash=8192,
             ),
-            "id" / Int32ul,
-            "access_hash" / If(this.flags.has_access_hash, Int64ul),
-            "title" / self.tstring_struct,
-            "username" / If(this.flags.has_username, self.tstring_struct),
-            "photo" / self.chat_photo_structures("photo"),
-            "date" / self.ttimestamp_struct,
-            "version" / Int32ul,
-            "restrict_reason" / If(this.flags.restricted, self.tstring_struct),
         )
 
+    @cached_struct
     def channel_layer72_struct(self):
-        return Struct(
-            "sname" / Computed("channel_layer72"),
-            "signature" / Hex(Const(0x0CB44B1C, Int32ul)),
-            "flags"
-            / FlagsEnum(
-                Int32ul,
+        return self.channel_layer_struct(
+            "channel_layer72",
+            0x0CB44B1C,
+            dict(
                 creator=1,
                 left=4,
                 broadcast=32,
@@ -627,29 +1134,19 @@ class tblob:  # pylint: disable=C0103
                 has_banned_rights=32768,
                 has_access_hash=8192,
             ),
-            "id" / Int32ul,
-            "access_hash" / If(this.flags.has_access_hash, Int64ul),
-            "title" / self.tstring_struct,
-            "username" / If(this.flags.has_username, self.tstring_struct),
-            "date" / self.ttimestamp_struct,
-            "version" / Int32ul,
-            "restrict_reason" / If(this.flags.restricted, self.tstring_struct),
-            "admin_rights"
-            / If(this.flags.has_admin_rights, self.channel_admin_rights_layer92_struct()),
-            "banned_rights"
-            / If(
-                this.flags.has_banned_rights,
+            photo=False,
+            rights_structs=(
+                self.channel_admin_rights_layer92_struct(),
                 self.channel_banned_rights_layer92_struct(),
             ),
         )
 
+    @cached_struct
     def channel_layer77_struct(self):
-        return Struct(
-            "sname" / Computed("channel_layer77"),
-            "signature" / Hex(Const(0x450B7115, Int32ul)),
-            "flags"
-            / FlagsEnum(
-                Int32ul,
+        return self.channel_layer_struct(
+            "channel_layer77",
+            0x450B7115,
+            dict(
                 creator=1,
                 left=4,
                 broadcast=32,
@@ -664,31 +1161,19 @@ class tblob:  # pylint: disable=C0103
                 has_participant_count=131072,
                 has_access_hash=8192,
             ),
-            "id" / Int32ul,
-            "access_hash" / If(this.flags.has_access_hash, Int64ul),
-            "title" / self.tstring_struct,
-            "username" / If(this.flags.has_username, self.tstring_struct),
-            "photo" / self.chat_photo_structures("photo"),
-            "date" / self.ttimestamp_struct,
-            "version" / Int32ul,
-            "restrict_reason" / If(this.flags.restricted, self.tstring_struct),
-            "admin_rights"
-            / If(this.flags.has_admin_rights, self.channel_admin_rights_layer92_struct()),
-            "banned_rights"
-            / If(
-                this.flags.has_banned_rights,
+            rights_structs=(
+                self.channel_admin_rights_layer92_struct(),
                 self.channel_banned_rights_layer92_struct(),
             ),
-            "participants_count" / If(this.flags.has_participant_count, Int32ul),
+            participants_count=True,
         )
 
+    @cached_struct
     def channel_layer92_struct(self):
-        return Struct(
-            "sname" / Computed("channel_layer92"),
-            "signature" / Hex(Const(0xC88974AC, Int32ul)),
-            "flags"
-            / FlagsEnum(
-                Int32ul,
+        return self.channel_layer_struct(
+            "channel_layer92",
+            0xC88974AC,
+            dict(
                 creator=1,
                 left=4,
                 broadcast=32,
@@ -703,31 +1188,20 @@ class tblob:  # pylint: disable=C0103
                 has_participant_count=131072,
                 has_access_hash=8192,
             ),
-            "id" / Int32ul,
-            "access_hash" / If(this.flags.has_access_hash, Int64ul),
-            "title" / self.tstring_struct,
-            "username" / If(this.flags.has_username, self.tstring_struct),
-            "photo" / self.chat_photo_structures("photo"),
-            "date" / self.ttimestamp_struct,
-            "version" / Int32ul,
-            "restrict_reason" / If(this.flags.restricted, self.tstring_struct),
-            "admin_rights"
-            / If(this.flags.has_admin_rights, self.channel_admin_rights_layer92_struct()),
-            "banned_rights"
-            / If(
-                this.flags.has_banned_rights,
+            rights_structs=(
+                self.channel_admin_rights_layer92_struct(),
                 self.channel_banned_rights_layer92_struct(),
             ),
-            "participants_count" / If(this.flags.has_participant_count, Int32ul),
+            participants_count=True,
         )
 
+    @cached_struct
     def channel_struct(self):
         return Struct(
             "sname" / Computed("channel"),
-            "signature" / Hex(Const(0xD31A961E, Int32ul)),
+            "signature" / TSignature(0xD31A961E),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 creator=1,
                 left=4,
                 broadcast=32,
@@ -768,13 +1242,13 @@ class tblob:  # pylint: disable=C0103
             "participants_count" / If(this.flags.has_participant_count, Int32ul),
         )
 
+    @cached_struct
     def chat_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("chat"),
-            "signature" / Hex(Const(0x3BDA1BDE, Int32ul)),
+            "signature" / TSignature(0x3BDA1BDE),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 creator=1,
                 kicked=2,
                 left=4,
@@ -795,10 +1269,11 @@ class tblob:  # pylint: disable=C0103
             "banned_rights" / If(this.flags.has_banned_rights, self.chat_banned_rights_struct()),
         )
 
+    @cached_struct
     def chat_old_struct(self):
         return Struct(
             "sname" / Computed("chat_old"),
-            "signature" / Hex(Const(0x6E9C9BC7, Int32ul)),
+            "signature" / TSignature(0x6E9C9BC7),
             "id" / Int32ul,
             "title" / self.tstring_struct,
             "photo" / self.chat_photo_structures("photo"),
@@ -808,11 +1283,12 @@ class tblob:  # pylint: disable=C0103
             "version" / Int32ul,
         )
 
+    @cached_struct
     def chat_old2_struct(self):
         return Struct(
             "sname" / Computed("chat_old2"),
-            "signature" / Hex(Const(0x7312BC48, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, creator=1, kicked=2, left=4, deactivated=32),
+            "signature" / TSignature(0x7312BC48),
+            "flags" / TFlags(creator=1, kicked=2, left=4, deactivated=32),
             "id" / Int32ul,
             "title" / self.tstring_struct,
             "photo" / self.chat_photo_structures("photo"),
@@ -821,29 +1297,32 @@ class tblob:  # pylint: disable=C0103
             "version" / Int32ul,
         )
 
+    @cached_struct
     def chat_forbidden_struct(self):
         return Struct(
             "sname" / Computed("chat_forbidden"),
-            "signature" / Hex(Const(0x07328BDB, Int32ul)),
+            "signature" / TSignature(0x07328BDB),
             "id" / Int32ul,
             "title" / self.tstring_struct,
         )
 
+    @cached_struct
     def chat_forbidden_old_struct(self):
         return Struct(
             "sname" / Computed("chat_forbidden_old"),
-            "signature" / Hex(Const(0xFB0CCC41, Int32ul)),
+            "signature" / TSignature(0xFB0CCC41),
             "id" / Int32ul,
             "title" / self.tstring_struct,
             "date" / Int32ul,
         )
 
+    @cached_struct
     def chat_layer92_struct(self):
         return Struct(
             "sname" / Computed("chat_layer92"),
-            "signature" / Hex(Const(0xD91CDD54, Int32ul)),
+            "signature" / TSignature(0xD91CDD54),
             "flags"
-            / FlagsEnum(Int32ul, creator=1, kicked=2, left=4, deactivated=32, is_migrated=64),
+            / TFlags(creator=1, kicked=2, left=4, deactivated=32, is_migrated=64),
             "id" / Int32ul,
             "title" / self.tstring_struct,
             "photo" / self.chat_photo_structures("photo"),
@@ -856,120 +1335,103 @@ class tblob:  # pylint: disable=C0103
 
     def chat_structures(self, name):
         tag_map = {
-            0xD31A961E: LazyBound(lambda: self.channel_struct()),
-            0x8537784F: LazyBound(lambda: self.channel_forbidden_layer67_struct()),
-            0x9BA2D800: LazyBound(lambda: self.chat_empty_struct()),
-            0xA14DCA52: LazyBound(lambda: self.channel_layer67_struct()),
-            0xC88974AC: LazyBound(lambda: self.channel_layer92_struct()),
-            0xD91CDD54: LazyBound(lambda: self.chat_layer92_struct()),
-            0xFB0CCC41: LazyBound(lambda: self.chat_forbidden_old_struct()),
-            0x07328BDB: LazyBound(lambda: self.chat_forbidden_struct()),
-            0x0CB44B1C: LazyBound(lambda: self.channel_layer72_struct()),
-            0x289DA732: LazyBound(lambda: self.channel_forbidden_struct()),
-            0x2D85832C: LazyBound(lambda: self.channel_forbidden_layer52_struct()),
-            0x3BDA1BDE: LazyBound(lambda: self.chat_struct()),
-            0x450B7115: LazyBound(lambda: self.channel_layer77_struct()),
-            0x4B1B7506: LazyBound(lambda: self.channel_layer48_struct()),
-            0x4DF30834: LazyBound(lambda: self.channel_layer104_struct()),
-            0x678E9587: LazyBound(lambda: self.channel_old_struct()),
-            0x6E9C9BC7: LazyBound(lambda: self.chat_old_struct()),
-            0x7312BC48: LazyBound(lambda: self.chat_old2_struct()),
+            0xD31A961E: self.channel_struct(),
+            0x8537784F: self.channel_forbidden_layer67_struct(),
+            0x9BA2D800: self.chat_empty_struct(),
+            0xA14DCA52: self.channel_layer67_struct(),
+            0xC88974AC: self.channel_layer92_struct(),
+            0xD91CDD54: self.chat_layer92_struct(),
+            0xFB0CCC41: self.chat_forbidden_old_struct(),
+            0x07328BDB: self.chat_forbidden_struct(),
+            0x0CB44B1C: self.channel_layer72_struct(),
+            0x289DA732: self.channel_forbidden_struct(),
+            0x2D85832C: self.channel_forbidden_layer52_struct(),
+            0x3BDA1BDE: self.chat_struct(),
+            0x450B7115: self.channel_layer77_struct(),
+            0x4B1B7506: self.channel_layer48_struct(),
+            0x4DF30834: self.channel_layer104_struct(),
+            0x678E9587: self.channel_old_struct(),
+            0x6E9C9BC7: self.chat_old_struct(),
+            0x7312BC48: self.chat_old2_struct(),
         }
-        return "chat_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "chat_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
-    def chat_photo_layer115_struct(self):
-        return Struct(
-            "sname" / Computed("chat_photo_layer115"),
-            "signature" / Hex(Const(0x475CDBD5, Int32ul)),
+    def chat_photo_layer_struct(self, name, signature, flags=False, dc_id=False):
+        """Builds the chat_photo* structs, which only differ by the presence
+        of the flags and dc_id fields around the same photo locations."""
+        fields = [
+            "sname" / Computed(name),
+            "signature" / TSignature(signature),
+        ]
+        if flags:
+            fields.append("flags" / TFlags(has_video=1))
+        fields += [
             "photo_small" / self.file_location_structures("photo_small"),
             "photo_big" / self.file_location_structures("photo_big"),
-            "dc_id" / Int32ul,
-        )
+        ]
+        if dc_id:
+            fields.append("dc_id" / Int32ul)
+        return TStruct(*fields)
 
+    @cached_struct
+    def chat_photo_layer115_struct(self):
+        return self.chat_photo_layer_struct("chat_photo_layer115", 0x475CDBD5, dc_id=True)
+
+    @cached_struct
     def chat_photo_empty_struct(self):
-        return Struct(
-            "sname" / Computed("chat_photo_empty"),
-            "signature" / Hex(Const(0x37C1011C, Int32ul)),
-        )
+        return TSignatureStruct("chat_photo_empty", 0x37C1011C)
 
+    @cached_struct
     def chat_photo_layer97_struct(self):
-        return Struct(
-            "sname" / Computed("chat_photo_layer97"),
-            "signature" / Hex(Const(0x6153276A, Int32ul)),
-            "photo_small" / self.file_location_structures("photo_small"),
-            "photo_big" / self.file_location_structures("photo_big"),
-        )
+        return self.chat_photo_layer_struct("chat_photo_layer97", 0x6153276A)
 
+    @cached_struct
     def chat_photo_struct(self):
-        return Struct(
-            "sname" / Computed("chat_photo"),
-            "signature" / Hex(Const(0xD20B9F3C, Int32ul)),
-            "flags"
-            / FlagsEnum(
-                Int32ul,
-                has_video=1,
-            ),
-            "photo_small" / self.file_location_structures("photo_small"),
-            "photo_big" / self.file_location_structures("photo_big"),
-            "dc_id" / Int32ul,
-        )
+        return self.chat_photo_layer_struct("chat_photo", 0xD20B9F3C, flags=True, dc_id=True)
 
     def chat_photo_structures(self, name):
         tag_map = {
-            0x37C1011C: LazyBound(lambda: self.chat_photo_empty_struct()),
-            0x6153276A: LazyBound(lambda: self.chat_photo_layer97_struct()),
-            0x475CDBD5: LazyBound(lambda: self.chat_photo_layer115_struct()),
-            0xD20B9F3C: LazyBound(lambda: self.chat_photo_struct()),
+            0x37C1011C: self.chat_photo_empty_struct(),
+            0x6153276A: self.chat_photo_layer97_struct(),
+            0x475CDBD5: self.chat_photo_layer115_struct(),
+            0xD20B9F3C: self.chat_photo_struct(),
         }
-        return "chat_photo_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "chat_photo_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def contact_link_contact_struct(self):
-        return Struct(
-            "sname" / Computed("contact_link_contact"),
-            "signature" / Hex(Const(0xD502C2D0, Int32ul)),
-        )
+        return TSignatureStruct("contact_link_contact", 0xD502C2D0)
 
+    @cached_struct
     def contact_link_none_struct(self):
-        return Struct(
-            "sname" / Computed("contact_link_none"),
-            "signature" / Hex(Const(0xFEEDD3AD, Int32ul)),
-        )
+        return TSignatureStruct("contact_link_none", 0xFEEDD3AD)
 
+    @cached_struct
     def contact_link_has_phone_struct(self):
-        return Struct(
-            "sname" / Computed("contact_link_has_phone"),
-            "signature" / Hex(Const(0x268F3F59, Int32ul)),
-        )
+        return TSignatureStruct("contact_link_has_phone", 0x268F3F59)
 
+    @cached_struct
     def contact_link_unknown_struct(self):
-        return Struct(
-            "sname" / Computed("contact_link_unknown"),
-            "signature" / Hex(Const(0x5F4F9247, Int32ul)),
-        )
+        return TSignatureStruct("contact_link_unknown", 0x5F4F9247)
 
     def contact_link_structures(self, name):
         tag_map = {
-            0xD502C2D0: LazyBound(lambda: self.contact_link_contact_struct()),
-            0xFEEDD3AD: LazyBound(lambda: self.contact_link_none_struct()),
-            0x268F3F59: LazyBound(lambda: self.contact_link_has_phone_struct()),
-            0x5F4F9247: LazyBound(lambda: self.contact_link_unknown_struct()),
+            0xD502C2D0: self.contact_link_contact_struct(),
+            0xFEEDD3AD: self.contact_link_none_struct(),
+            0x268F3F59: self.contact_link_has_phone_struct(),
+            0x5F4F9247: self.contact_link_unknown_struct(),
         }
-        return "contact_link_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "contact_link_structures" / TSignatureSwitch(name, tag_map)
 
+    @cached_struct
     def contacts_link_layer101_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("contacts_link_layer101"),
-            "signature" / Hex(Const(0x3ACE484C, Int32ul)),
+            "signature" / TSignature(0x3ACE484C),
             "my_link" / self.contact_link_structures("my_link"),
             "foreign_link" / self.contact_link_structures("foreign_link"),
             "user" / self.user_structures("user"),
@@ -977,233 +1439,243 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def decrypted_message_action_set_message_ttl_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_set_message_ttl"),
-            "signature" / Hex(Const(0xA1733AEC, Int32ul)),
+            "signature" / TSignature(0xA1733AEC),
             "ttl_seconds" / Int32ul,
         )
 
+    @cached_struct
     def decrypted_message_action_screenshot_messages_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_screenshot_messages"),
-            "signature" / Hex(Const(0x8AC1F475, Int32ul)),
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "signature" / TSignature(0x8AC1F475),
+            "_vector_sig" / self.tvector_signature,
             "random_ids_num" / Int32ul,
-            "random_ids_array" / Array(this.random_ids_num, Int64ul),
+            "random_ids_array" / TIntArray(this.random_ids_num, Int64ul),
         )
 
+    @cached_struct
     def decrypted_message_action_noop_struct(self):
-        return Struct(
-            "sname" / Computed("decrypted_message_action_noop"),
-            "signature" / Hex(Const(0xA82FDD63, Int32ul)),
-        )
+        return TSignatureStruct("decrypted_message_action_noop", 0xA82FDD63)
 
+    @cached_struct
     def decrypted_message_action_typing_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_typing"),
-            "signature" / Hex(Const(0xCCB27641, Int32ul)),
+            "signature" / TSignature(0xCCB27641),
             "action" / self.send_message_action_structures("action"),
         )
 
+    @cached_struct
     def decrypted_message_action_abort_key_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_abort_key"),
-            "signature" / Hex(Const(0xDD05EC6B, Int32ul)),
+            "signature" / TSignature(0xDD05EC6B),
             "exchange_id" / Int64ul,
         )
 
+    @cached_struct
     def decrypted_message_action_commit_key_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_commit_key"),
-            "signature" / Hex(Const(0xEC2E0B9B, Int32ul)),
+            "signature" / TSignature(0xEC2E0B9B),
             "exchange_id" / Int64ul,
             "key_fingerprint" / Int64ul,
         )
 
+    @cached_struct
     def decrypted_message_action_notify_layer_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_notify_layer"),
-            "signature" / Hex(Const(0xF3048883, Int32ul)),
+            "signature" / TSignature(0xF3048883),
             "layer" / Int32ul,
         )
 
+    @cached_struct
     def decrypted_message_action_request_key_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_request_key"),
-            "signature" / Hex(Const(0xF3C9611B, Int32ul)),
+            "signature" / TSignature(0xF3C9611B),
             "exchange_id" / Int64ul,
             "g_a" / self.tbytes_struct,
         )
 
+    @cached_struct
     def decrypted_message_action_read_messages_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_read_messages"),
-            "signature" / Hex(Const(0x0C4F40BE, Int32ul)),
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "signature" / TSignature(0x0C4F40BE),
+            "_vector_sig" / self.tvector_signature,
             "random_ids_num" / Int32ul,
-            "random_ids_array" / Array(this.random_ids_num, Int64ul),
+            "random_ids_array" / TIntArray(this.random_ids_num, Int64ul),
         )
 
+    @cached_struct
     def decrypted_message_action_resend_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_resend"),
-            "signature" / Hex(Const(0x511110B0, Int32ul)),
+            "signature" / TSignature(0x511110B0),
             "start_seq_no" / Int32ul,
             "end_seq_no" / Int32ul,
         )
 
+    @cached_struct
     def decrypted_message_action_delete_messages_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_delete_messages"),
-            "signature" / Hex(Const(0x65614304, Int32ul)),
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "signature" / TSignature(0x65614304),
+            "_vector_sig" / self.tvector_signature,
             "random_ids_num" / Int32ul,
-            "random_ids_array" / Array(this.random_ids_num, Int64ul),
+            "random_ids_array" / TIntArray(this.random_ids_num, Int64ul),
         )
 
+    @cached_struct
     def decrypted_message_action_flush_history_struct(self):
-        return Struct(
-            "sname" / Computed("decrypted_message_action_flush_history"),
-            "signature" / Hex(Const(0x6719E45C, Int32ul)),
-        )
+        return TSignatureStruct("decrypted_message_action_flush_history", 0x6719E45C)
 
+    @cached_struct
     def decrypted_message_action_accept_key_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("decrypted_message_action_accept_key"),
-            "signature" / Hex(Const(0x6FE1735B, Int32ul)),
+            "signature" / TSignature(0x6FE1735B),
             "exchange_id" / Int64ul,
             "g_b" / self.tbytes_struct,
             "key_fingerprint" / Int64ul,
         )
 
+    @cached_struct
     def decrypted_message_action_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x8AC1F475: LazyBound(
-                lambda: self.decrypted_message_action_screenshot_messages_struct()
-            ),
-            0xA82FDD63: LazyBound(lambda: self.decrypted_message_action_noop_struct()),
-            0xCCB27641: LazyBound(lambda: self.decrypted_message_action_typing_struct()),
-            0xDD05EC6B: LazyBound(lambda: self.decrypted_message_action_abort_key_struct()),
-            0xEC2E0B9B: LazyBound(lambda: self.decrypted_message_action_commit_key_struct()),
-            0xF3048883: LazyBound(lambda: self.decrypted_message_action_notify_layer_struct()),
-            0xF3C9611B: LazyBound(lambda: self.decrypted_message_action_request_key_struct()),
-            0x0C4F40BE: LazyBound(lambda: self.decrypted_message_action_read_messages_struct()),
-            0x511110B0: LazyBound(lambda: self.decrypted_message_action_resend_struct()),
-            0x65614304: LazyBound(lambda: self.decrypted_message_action_delete_messages_struct()),
-            0x6719E45C: LazyBound(lambda: self.decrypted_message_action_flush_history_struct()),
-            0x6FE1735B: LazyBound(lambda: self.decrypted_message_action_accept_key_struct()),
-            0xA1733AEC: LazyBound(lambda: self.decrypted_message_action_set_message_ttl_struct()),
+            0x8AC1F475: self.decrypted_message_action_screenshot_messages_struct(),
+            0xA82FDD63: self.decrypted_message_action_noop_struct(),
+            0xCCB27641: self.decrypted_message_action_typing_struct(),
+            0xDD05EC6B: self.decrypted_message_action_abort_key_struct(),
+            0xEC2E0B9B: self.decrypted_message_action_commit_key_struct(),
+            0xF3048883: self.decrypted_message_action_notify_layer_struct(),
+            0xF3C9611B: self.decrypted_message_action_request_key_struct(),
+            0x0C4F40BE: self.decrypted_message_action_read_messages_struct(),
+            0x511110B0: self.decrypted_message_action_resend_struct(),
+            0x65614304: self.decrypted_message_action_delete_messages_struct(),
+            0x6719E45C: self.decrypted_message_action_flush_history_struct(),
+            0x6FE1735B: self.decrypted_message_action_accept_key_struct(),
+            0xA1733AEC: self.decrypted_message_action_set_message_ttl_struct(),
         }
-        return "decrypted_message_action_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "decrypted_message_action_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def document_attribute_has_stickers_struct(self):
-        return Struct(
-            "sname" / Computed("document_attribute_has_stickers"),
-            "signature" / Hex(Const(0x9801D2F7, Int32ul)),
-        )
+        return TSignatureStruct("document_attribute_has_stickers", 0x9801D2F7)
 
+    @cached_struct
     def document_attribute_sticker_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_sticker_old"),
-            "signature" / Hex(Const(0xFB0A5727, Int32ul)),
+            "signature" / TSignature(0xFB0A5727),
             "alt" / self.tstring_struct,
         )
 
+    @cached_struct
     def document_attribute_sticker_old2_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_sticker_old2"),
-            "signature" / Hex(Const(0x994C9882, Int32ul)),
+            "signature" / TSignature(0x994C9882),
             "alt" / self.tstring_struct,
         )
 
+    @cached_struct
     def document_attribute_audio_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_audio"),
-            "signature" / Hex(Const(0x9852F9C6, Int32ul)),
-            "flags"
-            / FlagsEnum(Int32ul, has_title=1, has_performer=2, has_waveform=4, is_voice=1024),
+            "signature" / TSignature(0x9852F9C6),
+            "flags" / TFlags(has_title=1, has_performer=2, has_waveform=4, is_voice=1024),
             "duration" / Int32ul,
-            "title" / If(this.flags.has_title, self.tstring_struct),
-            "performer" / If(this.flags.has_performer, self.tstring_struct),
-            "waveform" / If(this.flags.has_waveform, self.tbytes_struct),
+            "title" / TFlagIf("has_title", self.tstring_struct),
+            "performer" / TFlagIf("has_performer", self.tstring_struct),
+            "waveform" / TFlagIf("has_waveform", self.tbytes_struct),
         )
 
+    @cached_struct
     def document_attribute_audio_layer45_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_audio_layer45"),
-            "signature" / Hex(Const(0xDED218E0, Int32ul)),
+            "signature" / TSignature(0xDED218E0),
             "duration" / Int32ul,
             "title" / self.tstring_struct,
             "performer" / self.tstring_struct,
         )
 
+    @cached_struct
     def document_attribute_audio_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_audio_old"),
-            "signature" / Hex(Const(0x051448E5, Int32ul)),
+            "signature" / TSignature(0x051448E5),
             "duration" / Int32ul,
         )
 
+    @cached_struct
     def document_attribute_video_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_video"),
-            "signature" / Hex(Const(0x0EF02CE6, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, round_message=1, supports_streaming=2),
+            "signature" / TSignature(0x0EF02CE6),
+            "flags" / TFlags(round_message=1, supports_streaming=2),
             "duration" / Int32ul,
             "w" / Int32ul,
             "h" / Int32ul,
         )
 
+    @cached_struct
     def document_attribute_animated_struct(self):
-        return Struct(
-            "sname" / Computed("document_attribute_animated"),
-            "signature" / Hex(Const(0x11B58939, Int32ul)),
-        )
+        return TSignatureStruct("document_attribute_animated", 0x11B58939)
 
+    @cached_struct
     def document_attribute_filename_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_filename"),
-            "signature" / Hex(Const(0x15590068, Int32ul)),
+            "signature" / TSignature(0x15590068),
             "file_name" / self.tstring_struct,
         )
 
+    @cached_struct
     def document_attribute_sticker_layer55_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_sticker_layer55"),
-            "signature" / Hex(Const(0x3A556302, Int32ul)),
+            "signature" / TSignature(0x3A556302),
             "alt" / self.tstring_struct,
             "sticker_set" / self.input_sticker_set_structures("sticker_set"),
         )
 
+    @cached_struct
     def document_attribute_video_layer65_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_video_layer65"),
-            "signature" / Hex(Const(0x5910CCCB, Int32ul)),
+            "signature" / TSignature(0x5910CCCB),
             "duration" / Int32ul,
             "w" / Int32ul,
             "h" / Int32ul,
         )
 
+    @cached_struct
     def document_attribute_sticker_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_sticker"),
-            "signature" / Hex(Const(0x6319D612, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_mask_coords=1, mask=2),
+            "signature" / TSignature(0x6319D612),
+            "flags" / TFlags(has_mask_coords=1, mask=2),
             "alt" / self.tstring_struct,
             "sticker_set" / self.input_sticker_set_structures("sticker_set"),
-            "mask_coords" / If(this.flags.has_mask_coords, self.mask_coords_struct()),
+            "mask_coords" / TFlagIf("has_mask_coords", self.mask_coords_struct()),
         )
 
+    @cached_struct
     def document_attribute_image_size_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_attribute_image_size"),
-            "signature" / Hex(Const(0x6C37C15C, Int32ul)),
+            "signature" / TSignature(0x6C37C15C),
             "w" / Int32ul,
             "h" / Int32ul,
         )
@@ -1211,37 +1683,56 @@ class tblob:  # pylint: disable=C0103
     def document_attribute_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x9801D2F7: LazyBound(lambda: self.document_attribute_has_stickers_struct()),
-            0x9852F9C6: LazyBound(lambda: self.document_attribute_audio_struct()),
-            0x994C9882: LazyBound(lambda: self.document_attribute_sticker_old2_struct()),
-            0xDED218E0: LazyBound(lambda: self.document_attribute_audio_layer45_struct()),
-            0xFB0A5727: LazyBound(lambda: self.document_attribute_sticker_old_struct()),
-            0x051448E5: LazyBound(lambda: self.document_attribute_audio_old_struct()),
-            0x0EF02CE6: LazyBound(lambda: self.document_attribute_video_struct()),
-            0x11B58939: LazyBound(lambda: self.document_attribute_animated_struct()),
-            0x15590068: LazyBound(lambda: self.document_attribute_filename_struct()),
-            0x3A556302: LazyBound(lambda: self.document_attribute_sticker_layer55_struct()),
-            0x5910CCCB: LazyBound(lambda: self.document_attribute_video_layer65_struct()),
-            0x6319D612: LazyBound(lambda: self.document_attribute_sticker_struct()),
-            0x6C37C15C: LazyBound(lambda: self.document_attribute_image_size_struct()),
+            0x9801D2F7: self.document_attribute_has_stickers_struct(),
+            0x9852F9C6: self.document_attribute_audio_struct(),
+            0x994C9882: self.document_attribute_sticker_old2_struct(),
+            0xDED218E0: self.document_attribute_audio_layer45_struct(),
+            0xFB0A5727: self.document_attribute_sticker_old_struct(),
+            0x051448E5: self.document_attribute_audio_old_struct(),
+            0x0EF02CE6: self.document_attribute_video_struct(),
+            0x11B58939: self.document_attribute_animated_struct(),
+            0x15590068: self.document_attribute_filename_struct(),
+            0x3A556302: self.document_attribute_sticker_layer55_struct(),
+            0x5910CCCB: self.document_attribute_video_layer65_struct(),
+            0x6319D612: self.document_attribute_sticker_struct(),
+            0x6C37C15C: self.document_attribute_image_size_struct(),
         }
-        return "document_attribute_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "document_attribute_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
+    def document_photo_sizes_struct(self, name):
+        """The photo_size vector of the document layers, name being the key
+        of its photo_size_structures items."""
+        return TStruct(
+            "_vector_sig" / self.tvector_signature,
+            "photo_sizes_num" / Int32ul,
+            "photo_sizes_array" / TArray(this.photo_sizes_num, self.photo_size_structures(name)),
+        )
+
+    @cached_struct
+    def document_video_sizes_struct(self):
+        return TStruct(
+            "_vector_sig" / self.tvector_signature,
+            "video_sizes_num" / Int32ul,
+            "video_sizes_array"
+            / TArray(this.video_sizes_num, self.video_size_structures("video_size")),
+        )
+
+    @cached_struct
     def document_empty_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_empty"),
-            "signature" / Hex(Const(0x36F8C871, Int32ul)),
+            "signature" / TSignature(0x36F8C871),
             "id" / Int64ul,
         )
 
+    @cached_struct
     def document_layer82_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_layer82"),
-            "signature" / Hex(Const(0x87232BC7, Int32ul)),
+            "signature" / TSignature(0x87232BC7),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1250,50 +1741,43 @@ class tblob:  # pylint: disable=C0103
             "thumb" / self.photo_size_structures("thumb"),
             "dc_id" / Int32ul,
             "_pad" / Int32ul,
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "_vector_sig" / self.tvector_signature,
             "document_attributes_num" / Int32ul,
             "document_attributes_array"
-            / Array(
+            / TArray(
                 this.document_attributes_num,
                 self.document_attribute_structures("document"),
             ),
         )
 
+    @cached_struct
     def document_layer113_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_layer113"),
-            "signature" / Hex(Const(0x9BA29CC1, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_photo_size=1, mask=2),
+            "signature" / TSignature(0x9BA29CC1),
+            "flags" / TFlags(has_photo_size=1, mask=2),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "file_reference" / self.tbytes_struct,
             "date" / self.ttimestamp_struct,
             "mime_type" / self.tstring_struct,
             "size" / Int32ul,
-            "photo_size"
-            / If(
-                this.flags.has_photo_size,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "photo_sizes_num" / Int32ul,
-                    "photo_sizes_array"
-                    / Array(this.photo_sizes_num, self.photo_size_structures("photo")),
-                ),
-            ),
+            "photo_size" / TFlagIf("has_photo_size", self.document_photo_sizes_struct("photo")),
             "dc_id" / Int32ul,
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "_vector_sig" / self.tvector_signature,
             "document_attributes_num" / Int32ul,
             "document_attributes_array"
-            / Array(
+            / TArray(
                 this.document_attributes_num,
                 self.document_attribute_structures("document"),
             ),
         )
 
+    @cached_struct
     def document_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_old"),
-            "signature" / Hex(Const(0x9EFC6326, Int32ul)),
+            "signature" / TSignature(0x9EFC6326),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "user_id" / Int32ul,
@@ -1305,10 +1789,11 @@ class tblob:  # pylint: disable=C0103
             "dc_id" / Int32ul,
         )
 
+    @cached_struct
     def document_layer53_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_layer53"),
-            "signature" / Hex(Const(0xF9A39F4F, Int32ul)),
+            "signature" / TSignature(0xF9A39F4F),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1316,19 +1801,20 @@ class tblob:  # pylint: disable=C0103
             "size" / Int32ul,
             "thumb" / self.photo_size_structures("thumb"),
             "dc_id" / Int32ul,
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "_vector_sig" / self.tvector_signature,
             "document_attributes_num" / Int32ul,
             "document_attributes_array"
-            / Array(
+            / TArray(
                 this.document_attributes_num,
                 self.document_attribute_structures("document"),
             ),
         )
 
+    @cached_struct
     def document_encrypted_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_encrypted_old"),
-            "signature" / Hex(Const(0x55555556, Int32ul)),
+            "signature" / TSignature(0x55555556),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "user_id" / Int32ul,
@@ -1342,10 +1828,11 @@ class tblob:  # pylint: disable=C0103
             "iv" / self.tbytes_struct,
         )
 
+    @cached_struct
     def document_encrypted_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_encrypted"),
-            "signature" / Hex(Const(0x55555558, Int32ul)),
+            "signature" / TSignature(0x55555558),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1353,10 +1840,10 @@ class tblob:  # pylint: disable=C0103
             "size" / Int32ul,
             "thumb" / self.photo_size_structures("thumb"),
             "dc_id" / Int32ul,
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "_vector_sig" / self.tvector_signature,
             "document_attributes_num" / Int32ul,
             "document_attributes_array"
-            / Array(
+            / TArray(
                 this.document_attributes_num,
                 self.document_attribute_structures("document"),
             ),
@@ -1364,10 +1851,11 @@ class tblob:  # pylint: disable=C0103
             "iv" / self.tbytes_struct,
         )
 
+    @cached_struct
     def document_layer92_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document_layer92"),
-            "signature" / Hex(Const(0x59534E4C, Int32ul)),
+            "signature" / TSignature(0x59534E4C),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "file_reference" / self.tbytes_struct,
@@ -1376,20 +1864,21 @@ class tblob:  # pylint: disable=C0103
             "size" / Int32ul,
             "thumb" / self.photo_size_structures("thumb"),
             "dc_id" / Int32ul,
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "_vector_sig" / self.tvector_signature,
             "document_attributes_num" / Int32ul,
             "document_attributes_array"
-            / Array(
+            / TArray(
                 this.document_attributes_num,
                 self.document_attribute_structures("document"),
             ),
         )
 
+    @cached_struct
     def document_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("document"),
-            "signature" / Hex(Const(0x1E87342B, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_photo_size=1, has_video_size=2),
+            "signature" / TSignature(0x1E87342B),
+            "flags" / TFlags(has_photo_size=1, has_video_size=2),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "file_reference" / self.tbytes_struct,
@@ -1397,67 +1886,51 @@ class tblob:  # pylint: disable=C0103
             "mime_type" / self.tstring_struct,
             "size" / Int32ul,
             "photo_size"
-            / If(
-                this.flags.has_photo_size,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "photo_sizes_num" / Int32ul,
-                    "photo_sizes_array"
-                    / Array(this.photo_sizes_num, self.photo_size_structures("photo_size")),
-                ),
-            ),
-            "video_size"
-            / If(
-                this.flags.has_video_size,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "video_sizes_num" / Int32ul,
-                    "video_sizes_array"
-                    / Array(this.video_sizes_num, self.video_size_structures("video_size")),
-                ),
-            ),
+            / TFlagIf("has_photo_size", self.document_photo_sizes_struct("photo_size")),
+            "video_size" / TFlagIf("has_video_size", self.document_video_sizes_struct()),
             "dc_id" / Int32ul,
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "_vector_sig" / self.tvector_signature,
             "document_attributes_num" / Int32ul,
             "document_attributes_array"
-            / Array(
+            / TArray(
                 this.document_attributes_num,
                 self.document_attribute_structures("document"),
             ),
         )
 
+    @cached_struct
     def document_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x1E87342B: LazyBound(lambda: self.document_struct()),
-            0x87232BC7: LazyBound(lambda: self.document_layer82_struct()),
-            0x9BA29CC1: LazyBound(lambda: self.document_layer113_struct()),
-            0x9EFC6326: LazyBound(lambda: self.document_old_struct()),
-            0xF9A39F4F: LazyBound(lambda: self.document_layer53_struct()),
-            0x36F8C871: LazyBound(lambda: self.document_empty_struct()),
-            0x55555556: LazyBound(lambda: self.document_encrypted_old_struct()),
-            0x55555558: LazyBound(lambda: self.document_encrypted_struct()),
-            0x59534E4C: LazyBound(lambda: self.document_layer92_struct()),
+            0x1E87342B: self.document_struct(),
+            0x87232BC7: self.document_layer82_struct(),
+            0x9BA29CC1: self.document_layer113_struct(),
+            0x9EFC6326: self.document_old_struct(),
+            0xF9A39F4F: self.document_layer53_struct(),
+            0x36F8C871: self.document_empty_struct(),
+            0x55555556: self.document_encrypted_old_struct(),
+            0x55555558: self.document_encrypted_struct(),
+            0x59534E4C: self.document_layer92_struct(),
         }
-        return "document_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "document_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def encrypted_chat_empty_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("encrypted_chat_empty"),
-            "signature" / Hex(Const(0xAB7EC0A0, Int32ul)),
+            "signature" / TSignature(0xAB7EC0A0),
             "id" / Int32ul,
         )
 
+    @cached_struct
     def encrypted_chat_requested_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("encrypted_chat_requested"),
-            "signature" / Hex(Const(0x62718A82, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_folder_is=1),
-            "folder_id" / If(this.flags.has_folder_id, Int32ul),
+            "signature" / TSignature(0x62718A82),
+            "flags" / TFlags(has_folder_is=1),
+            "folder_id" / TFlagIf("has_folder_id", Int32ul),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1466,10 +1939,11 @@ class tblob:  # pylint: disable=C0103
             "g_a" / self.tbytes_struct,
         )
 
+    @cached_struct
     def encrypted_chat_requested_layer115_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("encrypted_chat_requested_layer115"),
-            "signature" / Hex(Const(0xC878527E, Int32ul)),
+            "signature" / TSignature(0xC878527E),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1478,10 +1952,11 @@ class tblob:  # pylint: disable=C0103
             "g_a" / self.tbytes_struct,
         )
 
+    @cached_struct
     def encrypted_chat_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("encrypted_chat"),
-            "signature" / Hex(Const(0xFA56CE36, Int32ul)),
+            "signature" / TSignature(0xFA56CE36),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1491,10 +1966,11 @@ class tblob:  # pylint: disable=C0103
             "key_fingerprint" / Int64ul,
         )
 
+    @cached_struct
     def encrypted_chat_requested_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("encrypted_chat_requested_old"),
-            "signature" / Hex(Const(0xFDA9A7B7, Int32ul)),
+            "signature" / TSignature(0xFDA9A7B7),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1504,17 +1980,19 @@ class tblob:  # pylint: disable=C0103
             "nonce" / self.tbytes_struct,
         )
 
+    @cached_struct
     def encrypted_chat_discarded_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("encrypted_chat_discarded"),
-            "signature" / Hex(Const(0x13D6DD27, Int32ul)),
+            "signature" / TSignature(0x13D6DD27),
             "id" / Int32ul,
         )
 
+    @cached_struct
     def encrypted_chat_waiting_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("encrypted_chat_waiting"),
-            "signature" / Hex(Const(0x3BF703DC, Int32ul)),
+            "signature" / TSignature(0x3BF703DC),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1522,10 +2000,11 @@ class tblob:  # pylint: disable=C0103
             "participant_id" / Int32ul,
         )
 
+    @cached_struct
     def encrypted_chat_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("encrypted_chat_old"),
-            "signature" / Hex(Const(0x6601D14F, Int32ul)),
+            "signature" / TSignature(0x6601D14F),
             "id" / Int32ul,
             "access_hash" / Int64ul,
             "date" / self.ttimestamp_struct,
@@ -1536,38 +2015,39 @@ class tblob:  # pylint: disable=C0103
             "key_fingerprint" / Int64ul,
         )
 
+    @cached_struct
     def encrypted_chat_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x62718A82: LazyBound(lambda: self.encrypted_chat_requested_struct()),
-            0xAB7EC0A0: LazyBound(lambda: self.encrypted_chat_empty_struct()),
-            0xC878527E: LazyBound(lambda: self.encrypted_chat_requested_layer115_struct()),
-            0xFA56CE36: LazyBound(lambda: self.encrypted_chat_struct()),
-            0xFDA9A7B7: LazyBound(lambda: self.encrypted_chat_requested_old_struct()),
-            0x13D6DD27: LazyBound(lambda: self.encrypted_chat_discarded_struct()),
-            0x3BF703DC: LazyBound(lambda: self.encrypted_chat_waiting_struct()),
-            0x6601D14F: LazyBound(lambda: self.encrypted_chat_old_struct()),
+            0x62718A82: self.encrypted_chat_requested_struct(),
+            0xAB7EC0A0: self.encrypted_chat_empty_struct(),
+            0xC878527E: self.encrypted_chat_requested_layer115_struct(),
+            0xFA56CE36: self.encrypted_chat_struct(),
+            0xFDA9A7B7: self.encrypted_chat_requested_old_struct(),
+            0x13D6DD27: self.encrypted_chat_discarded_struct(),
+            0x3BF703DC: self.encrypted_chat_waiting_struct(),
+            0x6601D14F: self.encrypted_chat_old_struct(),
         }
-        return "encrypted_chat_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "encrypted_chat_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def file_location_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("file_location"),
-            "signature" / Hex(Const(0x53D69076, Int32ul)),
+            "signature" / TSignature(0x53D69076),
             "dc_id" / Int32ul,
             "volume_id" / Int64ul,
             "local_id" / Int32ul,
             "secret" / Int64ul,
         )
 
+    @cached_struct
     def file_encrypted_location_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("file_encrypted_location"),
-            "signature" / Hex(Const(0x55555554, Int32ul)),
+            "signature" / TSignature(0x55555554),
             "dc_id" / Int32ul,
             "volume_id" / Int64ul,
             "local_id" / Int32ul,
@@ -1576,29 +2056,32 @@ class tblob:  # pylint: disable=C0103
             "iv" / self.tbytes_struct,
         )
 
+    @cached_struct
     def file_location_unavailable_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("file_location_unavailable"),
-            "signature" / Hex(Const(0x7C596B46, Int32ul)),
+            "signature" / TSignature(0x7C596B46),
             "volume_id" / Int64ul,
             "local_id" / Int32ul,
             "secret" / Int64ul,
         )
 
+    @cached_struct
     def file_location_layer82_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("file_location"),
-            "signature" / Hex(Const(0x53D69076, Int32ul)),
+            "signature" / TSignature(0x53D69076),
             "dc_id" / Int32ul,
             "volume_id" / Int64ul,
             "local_id" / Int32ul,
             "secret" / Int64ul,
         )
 
+    @cached_struct
     def file_location_layer97_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("file_location_layer97"),
-            "signature" / Hex(Const(0x091D11EB, Int32ul)),
+            "signature" / TSignature(0x091D11EB),
             "dc_id" / Int32ul,
             "volume_id" / Int64ul,
             "local_id" / Int32ul,
@@ -1606,121 +2089,121 @@ class tblob:  # pylint: disable=C0103
             "file_reference" / self.tbytes_struct,
         )
 
+    @cached_struct
     def file_location_to_be_deprecated_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("file_location_to_be_deprecated"),
-            "signature" / Hex(Const(0xBC7FC6CD, Int32ul)),
+            "signature" / TSignature(0xBC7FC6CD),
             "volume_id" / Int64ul,
             "local_id" / Int32ul,
         )
 
+    @cached_struct
     def file_location_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0xBC7FC6CD: LazyBound(lambda: self.file_location_to_be_deprecated_struct()),
-            0x091D11EB: LazyBound(lambda: self.file_location_layer97_struct()),
-            0x53D69076: LazyBound(lambda: self.file_location_layer82_struct()),
-            0x55555554: LazyBound(lambda: self.file_encrypted_location_struct()),
-            0x7C596B46: LazyBound(lambda: self.file_location_unavailable_struct()),
+            0xBC7FC6CD: self.file_location_to_be_deprecated_struct(),
+            0x091D11EB: self.file_location_layer97_struct(),
+            0x53D69076: self.file_location_layer82_struct(),
+            0x55555554: self.file_encrypted_location_struct(),
+            0x7C596B46: self.file_location_unavailable_struct(),
         }
-        return "file_location_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "file_location_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def game_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("game"),
-            "signature" / Hex(Const(0xBDF9653B, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_document=1),
+            "signature" / TSignature(0xBDF9653B),
+            "flags" / TFlags(has_document=1),
             "id" / Int64ul,
             "access_hash" / Int64ul,
             "short_name" / self.tstring_struct,
             "title" / self.tstring_struct,
             "description" / self.tstring_struct,
             "photo" / self.photo_structures("photo"),
-            "document" / If(this.flags.has_document, self.document_structures("document")),
+            "document" / TFlagIf("has_document", self.document_structures("document")),
         )
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def geo_point_empty_struct(self):
-        return Struct(
-            "sname" / Computed("geo_point_empty"),
-            "signature" / Hex(Const(0x1117DD5F, Int32ul)),
-        )
+        return TSignatureStruct("geo_point_empty", 0x1117DD5F)
 
+    @cached_struct
     def geo_point_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("geo_point"),
-            "signature" / Hex(Const(0x0296F104, Int32ul)),
+            "signature" / TSignature(0x0296F104),
             "long" / Float64b,
             "lat" / Float64b,
             "access_hash" / Int64ul,
         )
 
+    @cached_struct
     def geo_point_layer81_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("geo_point_layer81"),
-            "signature" / Hex(Const(0x2049D70C, Int32ul)),
+            "signature" / TSignature(0x2049D70C),
             "long" / Float64b,
             "lat" / Float64b,
         )
 
+    @cached_struct
     def geo_point_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x0296F104: LazyBound(lambda: self.geo_point_struct()),
-            0x1117DD5F: LazyBound(lambda: self.geo_point_empty_struct()),
-            0x2049D70C: LazyBound(lambda: self.geo_point_layer81_struct()),
+            0x0296F104: self.geo_point_struct(),
+            0x1117DD5F: self.geo_point_empty_struct(),
+            0x2049D70C: self.geo_point_layer81_struct(),
         }
-        return "geo_point_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "geo_point_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def input_channel_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("input_channel"),
-            "signature" / Hex(Const(0xAFEB712E, Int32ul)),
+            "signature" / TSignature(0xAFEB712E),
             "channel_id" / Int32ul,
             "access_hash" / Int64ul,
         )
 
+    @cached_struct
     def input_channel_empty_struct(self):
-        return Struct(
-            "sname" / Computed("input_channel_empty"),
-            "signature" / Hex(Const(0xEE8C1E86, Int32ul)),
-        )
+        return TSignatureStruct("input_channel_empty", 0xEE8C1E86)
 
+    @cached_struct
     def input_channel_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0xAFEB712E: LazyBound(lambda: self.input_channel_struct()),
-            0xEE8C1E86: LazyBound(lambda: self.input_channel_empty_struct()),
+            0xAFEB712E: self.input_channel_struct(),
+            0xEE8C1E86: self.input_channel_empty_struct(),
         }
-        return "input_channel_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "input_channel_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def input_group_call_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("input_group_call"),
-            "signature" / Hex(Const(0xD8AA840F, Int32ul)),
+            "signature" / TSignature(0xD8AA840F),
             "id" / Int64ul,
             "access_hash" / Int64ul,
         )
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def input_message_entity_mention_name_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("input_message_entity_mention_name"),
-            "signature" / Hex(Const(0x208E68C9, Int32ul)),
+            "signature" / TSignature(0x208E68C9),
             "offset" / Int32ul,
             "length" / Int32ul,
             "user_id" / self.input_user_struct(),
@@ -1728,174 +2211,184 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def input_sticker_set_animated_emoji_struct(self):
-        return Struct("sname" / Computed("input_sticker_set_animated_emoji"))
+        return TStruct("sname" / Computed("input_sticker_set_animated_emoji"))
 
+    @cached_struct
     def input_sticker_set_dice_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("input_sticker_set_dice"),
-            "signature" / Hex(Const(0xE67F520E, Int32ul)),
+            "signature" / TSignature(0xE67F520E),
             "emoticon" / self.tstring_struct,
         )
 
+    @cached_struct
     def input_sticker_set_empty_struct(self):
-        return Struct(
-            "sname" / Computed("input_sticker_set_empty"),
-            "signature" / Hex(Const(0xFFB62B95, Int32ul)),
-        )
+        return TSignatureStruct("input_sticker_set_empty", 0xFFB62B95)
 
+    @cached_struct
     def input_sticker_set_id_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("input_sticker_set_id"),
-            "signature" / Hex(Const(0x9DE7A269, Int32ul)),
+            "signature" / TSignature(0x9DE7A269),
             "id" / Int64ul,
             "access_hash" / Int64ul,
         )
 
+    @cached_struct
     def input_sticker_set_short_name_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("input_sticker_set_short_name"),
-            "signature" / Hex(Const(0x861CC8A0, Int32ul)),
+            "signature" / TSignature(0x861CC8A0),
             "short_name" / self.tstring_struct,
         )
 
+    @cached_struct
     def input_sticker_set_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x028703C8: LazyBound(lambda: self.input_sticker_set_animated_emoji_struct()),
-            0xE67F520E: LazyBound(lambda: self.input_sticker_set_dice_struct()),
-            0xFFB62B95: LazyBound(lambda: self.input_sticker_set_empty_struct()),
-            0x9DE7A269: LazyBound(lambda: self.input_sticker_set_id_struct()),
-            0x861CC8A0: LazyBound(lambda: self.input_sticker_set_short_name_struct()),
+            0x028703C8: self.input_sticker_set_animated_emoji_struct(),
+            0xE67F520E: self.input_sticker_set_dice_struct(),
+            0xFFB62B95: self.input_sticker_set_empty_struct(),
+            0x9DE7A269: self.input_sticker_set_id_struct(),
+            0x861CC8A0: self.input_sticker_set_short_name_struct(),
         }
-        return "input_sticker_set_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "input_sticker_set_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def input_user_empty_struct(self):
-        return Struct(
-            "sname" / Computed("input_user_empty"),
-            "signature" / Hex(Const(0xB98886CF, Int32ul)),
-        )
+        return TSignatureStruct("input_user_empty", 0xB98886CF)
 
+    @cached_struct
     def input_user_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("input_user"),
-            "signature" / Hex(Const(0xD8292816, Int32ul)),
+            "signature" / TSignature(0xD8292816),
             "user_id" / Int32ul,
             "access_hash" / Int64ul,
         )
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def keyboard_button_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button"),
-            "signature" / Hex(Const(0xA2FA4880, Int32ul)),
+            "signature" / TSignature(0xA2FA4880),
             "text" / self.tstring_struct,
         )
 
+    @cached_struct
     def keyboard_button_buy_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_buy"),
-            "signature" / Hex(Const(0xAFD93FBB, Int32ul)),
+            "signature" / TSignature(0xAFD93FBB),
             "text" / self.tstring_struct,
         )
 
+    @cached_struct
     def keyboard_button_request_phone_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_request_phone"),
-            "signature" / Hex(Const(0xB16A6C29, Int32ul)),
+            "signature" / TSignature(0xB16A6C29),
             "text" / self.tstring_struct,
         )
 
+    @cached_struct
     def keyboard_button_request_poll_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_request_poll"),
-            "signature" / Hex(Const(0xBBC7515D, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_quiz=1),
-            "quiz" / If(this.flags.has_quiz, self.tbool_struct),
+            "signature" / TSignature(0xBBC7515D),
+            "flags" / TFlags(has_quiz=1),
+            "quiz" / TFlagIf("has_quiz", self.tbool_struct),
             "text" / self.tstring_struct,
         )
 
+    @cached_struct
     def keyboard_button_request_geo_location_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_request_geo_location"),
-            "signature" / Hex(Const(0xFC796B3F, Int32ul)),
+            "signature" / TSignature(0xFC796B3F),
             "text" / self.tstring_struct,
         )
 
+    @cached_struct
     def keyboard_button_switch_inline_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_switch_inline"),
-            "signature" / Hex(Const(0x0568A748, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, same_peer=1),
+            "signature" / TSignature(0x0568A748),
+            "flags" / TFlags(same_peer=1),
             "text" / self.tstring_struct,
             "query" / self.tstring_struct,
         )
 
+    @cached_struct
     def keyboard_button_url_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_url"),
-            "signature" / Hex(Const(0x258AFF05, Int32ul)),
+            "signature" / TSignature(0x258AFF05),
             "text" / self.tstring_struct,
             "url" / self.tstring_struct,
         )
 
+    @cached_struct
     def keyboard_button_url_auth_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_url_auth"),
-            "signature" / Hex(Const(0x10B78D29, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_fwd_text=1),
+            "signature" / TSignature(0x10B78D29),
+            "flags" / TFlags(has_fwd_text=1),
             "text" / self.tstring_struct,
-            "fwd_text" / If(this.flags.has_fwd_text, self.tstring_struct),
+            "fwd_text" / TFlagIf("has_fwd_text", self.tstring_struct),
             "url" / self.tstring_struct,
             "button_id" / Int32ul,
         )
 
+    @cached_struct
     def keyboard_button_game_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_game"),
-            "signature" / Hex(Const(0x50F41CCF, Int32ul)),
+            "signature" / TSignature(0x50F41CCF),
             "text" / self.tstring_struct,
         )
 
+    @cached_struct
     def keyboard_button_callback_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_callback"),
-            "signature" / Hex(Const(0x683A5E46, Int32ul)),
+            "signature" / TSignature(0x683A5E46),
             "text" / self.tstring_struct,
             "data" / self.tbytes_struct,
         )
 
+    @cached_struct
     def keyboard_button_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x10B78D29: LazyBound(lambda: self.keyboard_button_url_auth_struct()),
-            0xBBC7515D: LazyBound(lambda: self.keyboard_button_request_poll_struct()),
-            0xA2FA4880: LazyBound(lambda: self.keyboard_button_struct()),
-            0xAFD93FBB: LazyBound(lambda: self.keyboard_button_buy_struct()),
-            0xB16A6C29: LazyBound(lambda: self.keyboard_button_request_phone_struct()),
-            0xFC796B3F: LazyBound(lambda: self.keyboard_button_request_geo_location_struct()),
-            0x0568A748: LazyBound(lambda: self.keyboard_button_switch_inline_struct()),
-            0x258AFF05: LazyBound(lambda: self.keyboard_button_url_struct()),
-            0x50F41CCF: LazyBound(lambda: self.keyboard_button_game_struct()),
-            0x683A5E46: LazyBound(lambda: self.keyboard_button_callback_struct()),
+            0x10B78D29: self.keyboard_button_url_auth_struct(),
+            0xBBC7515D: self.keyboard_button_request_poll_struct(),
+            0xA2FA4880: self.keyboard_button_struct(),
+            0xAFD93FBB: self.keyboard_button_buy_struct(),
+            0xB16A6C29: self.keyboard_button_request_phone_struct(),
+            0xFC796B3F: self.keyboard_button_request_geo_location_struct(),
+            0x0568A748: self.keyboard_button_switch_inline_struct(),
+            0x258AFF05: self.keyboard_button_url_struct(),
+            0x50F41CCF: self.keyboard_button_game_struct(),
+            0x683A5E46: self.keyboard_button_callback_struct(),
         }
-        return "keyboard_button_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "keyboard_button_structures" / TSignatureSwitch(name, tag_map)
 
+    @cached_struct
     def keyboard_button_row_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("keyboard_button_row"),
-            "signature" / Hex(Const(0x77608B83, Int32ul)),
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "signature" / TSignature(0x77608B83),
+            "_vector_sig" / self.tvector_signature,
             "keyboard_buttons_row_num" / Int32ul,
             "keyboard_buttons_row_array"
-            / Array(
+            / TArray(
                 this.keyboard_buttons_row_num,
                 self.keyboard_button_structures("keyboard_button"),
             ),
@@ -1903,10 +2396,11 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def mask_coords_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("mask_coords"),
-            "signature" / Hex(Const(0xAED6DBB2, Int32ul)),
+            "signature" / TSignature(0xAED6DBB2),
             "n" / Int32ul,
             "x" / Float64b,
             "y" / Float64b,
@@ -1915,459 +2409,412 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def message_action_chat_create_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_chat_create"),
-            "signature" / Hex(Const(0xA6638B9A, Int32ul)),
+            "signature" / TSignature(0xA6638B9A),
             "title" / self.tstring_struct,
-            "vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "vector_sig" / self.tvector_signature,
             "users_num" / Int32ul,
-            "users" / Array(this.users_num, Int32ul),
+            "users" / TIntArray(this.users_num, Int32ul),
         )
 
+    @cached_struct
     def message_action_chat_delete_photo_struct(self):
-        return Struct(
-            "sname" / Computed("message_action_chat_delete_photo"),
-            "signature" / Hex(Const(0x95E3FBEF, Int32ul)),
-        )
+        return TSignatureStruct("message_action_chat_delete_photo", 0x95E3FBEF)
 
+    @cached_struct
     def message_action_chat_delete_user_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_chat_delete_user"),
-            "signature" / Hex(Const(0xB2AE9B0C, Int32ul)),
+            "signature" / TSignature(0xB2AE9B0C),
             "user_id" / Int32ul,
         )
 
+    @cached_struct
     def message_action_chat_edit_title_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_chat_edit_title"),
-            "signature" / Hex(Const(0xB5A1CE5A, Int32ul)),
+            "signature" / TSignature(0xB5A1CE5A),
             "title" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_action_empty_struct(self):
-        return Struct(
-            "sname" / Computed("message_action_empty"),
-            "signature" / Hex(Const(0xB6AEF7B0, Int32ul)),
-        )
+        return TSignatureStruct("message_action_empty", 0xB6AEF7B0)
 
+    @cached_struct
     def message_action_ttl_change_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_ttl_change"),
-            "signature" / Hex(Const(0x55555552, Int32ul)),
+            "signature" / TSignature(0x55555552),
             "ttl_seconds" / Int32ul,
         )
 
+    @cached_struct
     def message_action_user_joined_struct(self):
-        return Struct(
-            "sname" / Computed("message_action_user_joined"),
-            "signature" / Hex(Const(0x55555550, Int32ul)),
-        )
+        return TSignatureStruct("message_action_user_joined", 0x55555550)
 
+    @cached_struct
     def message_action_login_unknown_location_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_login_unknown_location"),
-            "signature" / Hex(Const(0x555555F5, Int32ul)),
+            "signature" / TSignature(0x555555F5),
             "title" / self.tstring_struct,
             "address" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_action_chat_add_user_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_chat_add_user_old"),
-            "signature" / Hex(Const(0x5E3CFC4B, Int32ul)),
+            "signature" / TSignature(0x5E3CFC4B),
             "user_id" / Int32ul,
         )
 
+    @cached_struct
     def message_action_bot_allowed_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_bot_allowed"),
-            "signature" / Hex(Const(0xABE9AFFE, Int32ul)),
+            "signature" / TSignature(0xABE9AFFE),
             "domain" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_action_channel_create_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_channel_create"),
-            "signature" / Hex(Const(0x95D2AC92, Int32ul)),
+            "signature" / TSignature(0x95D2AC92),
             "title" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_action_channel_migrate_from_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_channel_migrate_from"),
-            "signature" / Hex(Const(0xB055EAEE, Int32ul)),
+            "signature" / TSignature(0xB055EAEE),
             "title" / self.tstring_struct,
             "chat_id" / Int32ul,
         )
 
+    @cached_struct
     def message_action_chat_edit_photo_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_chat_edit_photo"),
-            "signature" / Hex(Const(0x7FCB13A8, Int32ul)),
+            "signature" / TSignature(0x7FCB13A8),
             "photo" / self.photo_structures("photo"),
         )
 
+    @cached_struct
     def message_action_history_clear_struct(self):
-        return Struct(
-            "sname" / Computed("message_action_history_clear"),
-            "signature" / Hex(Const(0x9FBAB604, Int32ul)),
-        )
+        return TSignatureStruct("message_action_history_clear", 0x9FBAB604)
 
+    @cached_struct
     def message_action_game_score_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_game_score"),
-            "signature" / Hex(Const(0x92A72876, Int32ul)),
+            "signature" / TSignature(0x92A72876),
             "game_id" / Int64ul,
             "score" / Int32ul,
         )
 
+    @cached_struct
     def message_action_pin_message_struct(self):
-        return Struct(
-            "sname" / Computed("message_action_pin_message"),
-            "signature" / Hex(Const(0x94BD38ED, Int32ul)),
-        )
+        return TSignatureStruct("message_action_pin_message", 0x94BD38ED)
 
+    @cached_struct
     def message_action_phone_call_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_phone_call"),
-            "signature" / Hex(Const(0x80E11A7F, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, is_discarded=1, has_duration=2, is_video=4),
+            "signature" / TSignature(0x80E11A7F),
+            "flags" / TFlags(is_discarded=1, has_duration=2, is_video=4),
             "call_id" / Int64ul,
             "discard_reason"
-            / If(
-                this.flags.is_discarded,
-                self.phone_call_discard_reason_structures("discard_reason"),
-            ),
-            "duration" / If(this.flags.has_duration, Int32ul),
+            / TFlagIf("is_discarded", self.phone_call_discard_reason_structures("discard_reason")),
+            "duration" / TFlagIf("has_duration", Int32ul),
         )
 
+    @cached_struct
     def message_action_contact_sign_up_struct(self):
-        return Struct(
-            "sname" / Computed("message_action_contact_sign_up"),
-            "signature" / Hex(Const(0xF3F25F76, Int32ul)),
-        )
+        return TSignatureStruct("message_action_contact_sign_up", 0xF3F25F76)
 
+    @cached_struct
     def message_action_secure_values_sent_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_secure_values_sent"),
-            "signature" / Hex(Const(0xD95C6154, Int32ul)),
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "signature" / TSignature(0xD95C6154),
+            "_vector_sig" / self.tvector_signature,
             "secure_values_num" / Int32ul,
             "secure_value_array"
-            / Array(
+            / TArray(
                 this.secure_values_num,
                 self.secure_value_type_structures("secure_value"),
             ),
         )
 
+    @cached_struct
     def message_action_chat_joined_by_link_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_chat_joined_by_link"),
-            "signature" / Hex(Const(0xF89CF5E8, Int32ul)),
+            "signature" / TSignature(0xF89CF5E8),
             "inviter_id" / Int32ul,
         )
 
+    @cached_struct
     def message_action_custom_action_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_custom_action"),
-            "signature" / Hex(Const(0xFAE69F56, Int32ul)),
+            "signature" / TSignature(0xFAE69F56),
             "message" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_action_payment_sent_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_payment_sent_struct"),
-            "signature" / Hex(Const(0x40699CD0, Int32ul)),
+            "signature" / TSignature(0x40699CD0),
             "currency" / self.tstring_struct,
             "total_amount" / Int64ul,
         )
 
+    @cached_struct
     def message_action_screenshot_taken_struct(self):
-        return Struct(
-            "sname" / Computed("message_action_screenshot_taken"),
-            "signature" / Hex(Const(0x4792929B, Int32ul)),
-        )
+        return TSignatureStruct("message_action_screenshot_taken", 0x4792929B)
 
+    @cached_struct
     def message_action_chat_add_user_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_chat_add_user"),
-            "signature" / Hex(Const(0x488A7337, Int32ul)),
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "signature" / TSignature(0x488A7337),
+            "_vector_sig" / self.tvector_signature,
             "user_array_num" / Int32ul,
-            "user_array" / Array(this.user_array_num, Int32ul),
+            "user_array" / TIntArray(this.user_array_num, Int32ul),
         )
 
+    @cached_struct
     def message_action_chat_migrate_to_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_chat_migrate_to"),
-            "signature" / Hex(Const(0x51BDB021, Int32ul)),
+            "signature" / TSignature(0x51BDB021),
             "channel_id" / Int32ul,
         )
 
+    @cached_struct
     def message_action_user_updated_photo_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_user_updated_photo"),
-            "signature" / Hex(Const(0x55555551, Int32ul)),
+            "signature" / TSignature(0x55555551),
             "new_user_photo" / self.user_profile_photo_structures("new_user_photo"),
         )
 
+    @cached_struct
     def message_action_created_broadcast_list_struct(self):
-        return Struct(
-            "sname" / Computed("message_action_created_broadcast_list"),
-            "signature" / Hex(Const(0x55555557, Int32ul)),
-        )
+        return TSignatureStruct("message_action_created_broadcast_list", 0x55555557)
 
+    @cached_struct
     def message_encrypted_action_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_encrypted_action"),
-            "signature" / Hex(Const(0x555555F7, Int32ul)),
+            "signature" / TSignature(0x555555F7),
             "encrypted_action" / self.decrypted_message_action_structures("encrypted_action"),
         )
 
+    @cached_struct
     def message_action_group_call_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_action_group_call"),
-            "signature" / Hex(Const(0x7A0D7F42, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_duration=1),
+            "signature" / TSignature(0x7A0D7F42),
+            "flags" / TFlags(has_duration=1),
             "call" / self.input_group_call_struct(),
-            "duration" / If(this.flags.has_duration, Int32ul),
+            "duration" / TFlagIf("has_duration", Int32ul),
         )
 
+    @cached_struct
     def message_action_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x80E11A7F: LazyBound(lambda: self.message_action_phone_call_struct()),
-            0x92A72876: LazyBound(lambda: self.message_action_game_score_struct()),
-            0x94BD38ED: LazyBound(lambda: self.message_action_pin_message_struct()),
-            0x95D2AC92: LazyBound(lambda: self.message_action_channel_create_struct()),
-            0x95E3FBEF: LazyBound(lambda: self.message_action_chat_delete_photo_struct()),
-            0x9FBAB604: LazyBound(lambda: self.message_action_history_clear_struct()),
-            0xA6638B9A: LazyBound(lambda: self.message_action_chat_create_struct()),
-            0xABE9AFFE: LazyBound(lambda: self.message_action_bot_allowed_struct()),
-            0xB055EAEE: LazyBound(lambda: self.message_action_channel_migrate_from_struct()),
-            0xB2AE9B0C: LazyBound(lambda: self.message_action_chat_delete_user_struct()),
-            0xB5A1CE5A: LazyBound(lambda: self.message_action_chat_edit_title_struct()),
-            0xB6AEF7B0: LazyBound(lambda: self.message_action_empty_struct()),
-            0xD95C6154: LazyBound(lambda: self.message_action_secure_values_sent_struct()),
-            0xF3F25F76: LazyBound(lambda: self.message_action_contact_sign_up_struct()),
-            0xF89CF5E8: LazyBound(lambda: self.message_action_chat_joined_by_link_struct()),
-            0xFAE69F56: LazyBound(lambda: self.message_action_custom_action_struct()),
-            0x40699CD0: LazyBound(lambda: self.message_action_payment_sent_struct()),
-            0x4792929B: LazyBound(lambda: self.message_action_screenshot_taken_struct()),
-            0x488A7337: LazyBound(lambda: self.message_action_chat_add_user_struct()),
-            0x51BDB021: LazyBound(lambda: self.message_action_chat_migrate_to_struct()),
-            0x55555550: LazyBound(lambda: self.message_action_user_joined_struct()),
-            0x55555551: LazyBound(lambda: self.message_action_user_updated_photo_struct()),
-            0x55555552: LazyBound(lambda: self.message_action_ttl_change_struct()),
-            0x55555557: LazyBound(lambda: self.message_action_created_broadcast_list_struct()),
-            0x555555F5: LazyBound(lambda: self.message_action_login_unknown_location_struct()),
-            0x555555F7: LazyBound(lambda: self.message_encrypted_action_struct()),
-            0x5E3CFC4B: LazyBound(lambda: self.message_action_chat_add_user_old_struct()),
-            0x7A0D7F42: LazyBound(lambda: self.message_action_group_call_struct()),
-            0x7FCB13A8: LazyBound(lambda: self.message_action_chat_edit_photo_struct()),
+            0x80E11A7F: self.message_action_phone_call_struct(),
+            0x92A72876: self.message_action_game_score_struct(),
+            0x94BD38ED: self.message_action_pin_message_struct(),
+            0x95D2AC92: self.message_action_channel_create_struct(),
+            0x95E3FBEF: self.message_action_chat_delete_photo_struct(),
+            0x9FBAB604: self.message_action_history_clear_struct(),
+            0xA6638B9A: self.message_action_chat_create_struct(),
+            0xABE9AFFE: self.message_action_bot_allowed_struct(),
+            0xB055EAEE: self.message_action_channel_migrate_from_struct(),
+            0xB2AE9B0C: self.message_action_chat_delete_user_struct(),
+            0xB5A1CE5A: self.message_action_chat_edit_title_struct(),
+            0xB6AEF7B0: self.message_action_empty_struct(),
+            0xD95C6154: self.message_action_secure_values_sent_struct(),
+            0xF3F25F76: self.message_action_contact_sign_up_struct(),
+            0xF89CF5E8: self.message_action_chat_joined_by_link_struct(),
+            0xFAE69F56: self.message_action_custom_action_struct(),
+            0x40699CD0: self.message_action_payment_sent_struct(),
+            0x4792929B: self.message_action_screenshot_taken_struct(),
+            0x488A7337: self.message_action_chat_add_user_struct(),
+            0x51BDB021: self.message_action_chat_migrate_to_struct(),
+            0x55555550: self.message_action_user_joined_struct(),
+            0x55555551: self.message_action_user_updated_photo_struct(),
+            0x55555552: self.message_action_ttl_change_struct(),
+            0x55555557: self.message_action_created_broadcast_list_struct(),
+            0x555555F5: self.message_action_login_unknown_location_struct(),
+            0x555555F7: self.message_encrypted_action_struct(),
+            0x5E3CFC4B: self.message_action_chat_add_user_old_struct(),
+            0x7A0D7F42: self.message_action_group_call_struct(),
+            0x7FCB13A8: self.message_action_chat_edit_photo_struct(),
         }
-        return "message_action_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "message_action_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
-    def message_entity_italic_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_italic"),
-            "signature" / Hex(Const(0x826F8B60, Int32ul)),
+    def message_entity_range_struct(self, name, signature, *fields):
+        """Builds the message_entity* structs: the offset and length of the
+        entity in the message text, followed by its specific fields."""
+        return TStruct(
+            "sname" / Computed(name),
+            "signature" / TSignature(signature),
             "offset" / Int32ul,
             "length" / Int32ul,
+            *fields,
         )
 
-    def message_entity_phone_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_phone"),
-            "signature" / Hex(Const(0x9B69E34B, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+    @cached_struct
+    def message_entity_italic_struct(self):
+        return self.message_entity_range_struct("message_entity_italic", 0x826F8B60)
 
-    def message_entity_unknown_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_unknown"),
-            "signature" / Hex(Const(0xBB92BA95, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+    @cached_struct
+    def message_entity_phone_struct(self):
+        return self.message_entity_range_struct("message_entity_phone", 0x9B69E34B)
+
+    @cached_struct
+    def message_entity_unknown_struct(self):
+        return self.message_entity_range_struct("message_entity_unknown", 0xBB92BA95)
 
+    @cached_struct
     def message_entity_bank_card_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_bank_card"),
-            "signature" / Hex(Const(0x761E6AF4, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_bank_card", 0x761E6AF4)
 
+    @cached_struct
     def message_entity_blockquote_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_blockquote"),
-            "signature" / Hex(Const(0x020DF5D0, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_blockquote", 0x020DF5D0)
 
+    @cached_struct
     def message_entity_bold_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_bold"),
-            "signature" / Hex(Const(0xBD610BC9, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_bold", 0xBD610BC9)
 
+    @cached_struct
     def message_entity_mention_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_mention"),
-            "signature" / Hex(Const(0xFA04579D, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_mention", 0xFA04579D)
 
+    @cached_struct
     def message_entity_code_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_code"),
-            "signature" / Hex(Const(0x28A20571, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_code", 0x28A20571)
 
+    @cached_struct
     def message_entity_mention_name_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_mention_name"),
-            "signature" / Hex(Const(0x352DCA58, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-            "user_id" / Int32ul,
+        return self.message_entity_range_struct(
+            "message_entity_mention_name", 0x352DCA58, "user_id" / Int32ul
         )
 
+    @cached_struct
     def message_entity_cashtag_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_cashtag"),
-            "signature" / Hex(Const(0x4C4E743F, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_cashtag", 0x4C4E743F)
 
+    @cached_struct
     def message_entity_email_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_email"),
-            "signature" / Hex(Const(0x64E475C2, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_email", 0x64E475C2)
 
+    @cached_struct
     def message_entity_bot_command_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_bot_command"),
-            "signature" / Hex(Const(0x6CEF8AC7, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_bot_command", 0x6CEF8AC7)
 
+    @cached_struct
     def message_entity_url_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_url"),
-            "signature" / Hex(Const(0x6ED02538, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_url", 0x6ED02538)
 
+    @cached_struct
     def message_entity_hashtag_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_hashtag"),
-            "signature" / Hex(Const(0x6F635B0D, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_hashtag", 0x6F635B0D)
 
+    @cached_struct
     def message_entity_pre_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_pre"),
-            "signature" / Hex(Const(0x73924BE0, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-            "language" / self.tstring_struct,
+        return self.message_entity_range_struct(
+            "message_entity_pre", 0x73924BE0, "language" / self.tstring_struct
         )
 
+    @cached_struct
     def message_entity_text_url_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_text_url"),
-            "signature" / Hex(Const(0x76A6D327, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-            "url" / self.tstring_struct,
+        return self.message_entity_range_struct(
+            "message_entity_text_url", 0x76A6D327, "url" / self.tstring_struct
         )
 
+    @cached_struct
     def message_entity_strike_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_strike"),
-            "signature" / Hex(Const(0xBF0693D4, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
-        )
+        return self.message_entity_range_struct("message_entity_strike", 0xBF0693D4)
 
+    @cached_struct
     def message_entity_underline_struct(self):
-        return Struct(
-            "sname" / Computed("message_entity_underline"),
-            "signature" / Hex(Const(0x9C4E7E8B, Int32ul)),
-            "offset" / Int32ul,
-            "length" / Int32ul,
+        return self.message_entity_range_struct("message_entity_underline", 0x9C4E7E8B)
+
+    @cached_struct
+    def message_entities_struct(self):
+        """The message_entity vector of the message layers."""
+        return TStruct(
+            "_vector_sig" / self.tvector_signature,
+            "message_entity_num" / Int32ul,
+            "message_entity_array"
+            / TArray(this.message_entity_num, self.message_entity_structures("message_entity")),
         )
 
+    @cached_struct
     def message_entity_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x9C4E7E8B: LazyBound(lambda: self.message_entity_underline_struct()),
-            0xBF0693D4: LazyBound(lambda: self.message_entity_strike_struct()),
-            0x761E6AF4: LazyBound(lambda: self.message_entity_bank_card_struct()),
-            0x020DF5D0: LazyBound(lambda: self.message_entity_blockquote_struct()),
-            0x826F8B60: LazyBound(lambda: self.message_entity_italic_struct()),
-            0x9B69E34B: LazyBound(lambda: self.message_entity_phone_struct()),
-            0xBB92BA95: LazyBound(lambda: self.message_entity_unknown_struct()),
-            0xBD610BC9: LazyBound(lambda: self.message_entity_bold_struct()),
-            0xFA04579D: LazyBound(lambda: self.message_entity_mention_struct()),
-            0x208E68C9: LazyBound(lambda: self.input_message_entity_mention_name_struct()),
-            0x28A20571: LazyBound(lambda: self.message_entity_code_struct()),
-            0x352DCA58: LazyBound(lambda: self.message_entity_mention_name_struct()),
-            0x4C4E743F: LazyBound(lambda: self.message_entity_cashtag_struct()),
-            0x64E475C2: LazyBound(lambda: self.message_entity_email_struct()),
-            0x6CEF8AC7: LazyBound(lambda: self.message_entity_bot_command_struct()),
-            0x6ED02538: LazyBound(lambda: self.message_entity_url_struct()),
-            0x6F635B0D: LazyBound(lambda: self.message_entity_hashtag_struct()),
-            0x73924BE0: LazyBound(lambda: self.message_entity_pre_struct()),
-            0x76A6D327: LazyBound(lambda: self.message_entity_text_url_struct()),
+            0x9C4E7E8B: self.message_entity_underline_struct(),
+            0xBF0693D4: self.message_entity_strike_struct(),
+            0x761E6AF4: self.message_entity_bank_card_struct(),
+            0x020DF5D0: self.message_entity_blockquote_struct(),
+            0x826F8B60: self.message_entity_italic_struct(),
+            0x9B69E34B: self.message_entity_phone_struct(),
+            0xBB92BA95: self.message_entity_unknown_struct(),
+            0xBD610BC9: self.message_entity_bold_struct(),
+            0xFA04579D: self.message_entity_mention_struct(),
+            0x208E68C9: self.input_message_entity_mention_name_struct(),
+            0x28A20571: self.message_entity_code_struct(),
+            0x352DCA58: self.message_entity_mention_name_struct(),
+            0x4C4E743F: self.message_entity_cashtag_struct(),
+            0x64E475C2: self.message_entity_email_struct(),
+            0x6CEF8AC7: self.message_entity_bot_command_struct(),
+            0x6ED02538: self.message_entity_url_struct(),
+            0x6F635B0D: self.message_entity_hashtag_struct(),
+            0x73924BE0: self.message_entity_pre_struct(),
+            0x76A6D327: self.message_entity_text_url_struct(),
         }
-        return "message_entity_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "message_entity_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def message_empty_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_empty"),
-            "signature" / Hex(Const(0x83E5DE54, Int32ul)),
+            "signature" / TSignature(0x83E5DE54),
             "id" / Int32ul,
             # It seems empty messages without 'to_id' exists.
-            "_extra_signature" / Peek(Int32ul),
+            "_extra_signature" / TPeekSignature(),
             "to_id" / IfThenElse(this._extra_signature, self.peer_structures("to_id"), Terminated),
         )
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def message_fwd_header_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_fwd_header"),
-            "signature" / Hex(Const(0x353A686B, Int32ul)),
+            "signature" / TSignature(0x353A686B),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 has_from_id=1,
                 has_channel_id=2,
                 has_channel_post=4,
@@ -2376,25 +2823,25 @@ class tblob:  # pylint: disable=C0103
                 has_from_name=32,
                 has_psa_type=64,
             ),
-            "from_id" / If(this.flags.has_from_id, Int32ul),
-            "from_name" / If(this.flags.has_from_name, self.tstring_struct),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
+            "from_name" / TFlagIf("has_from_name", self.tstring_struct),
             "date" / self.ttimestamp_struct,
-            "channel_id" / If(this.flags.has_channel_id, Int32ul),
-            "channel_post" / If(this.flags.has_channel_post, Int32ul),
-            "post_author" / If(this.flags.has_post_author, self.tstring_struct),
+            "channel_id" / TFlagIf("has_channel_id", Int32ul),
+            "channel_post" / TFlagIf("has_channel_post", Int32ul),
+            "post_author" / TFlagIf("has_post_author", self.tstring_struct),
             "saved_from_peer"
-            / If(this.flags.has_saved_from_peer, self.peer_structures("saved_from_peer")),
-            "saved_from_msg_id" / If(this.flags.has_saved_from_peer, Int32ul),
-            "psa_type" / If(this.flags.has_psa_type, self.tstring_struct),
+            / TFlagIf("has_saved_from_peer", self.peer_structures("saved_from_peer")),
+            "saved_from_msg_id" / TFlagIf("has_saved_from_peer", Int32ul),
+            "psa_type" / TFlagIf("has_psa_type", self.tstring_struct),
         )
 
+    @cached_struct
     def message_fwd_header_layer112_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_fwd_header_layer112"),
-            "signature" / Hex(Const(0xEC338270, Int32ul)),
+            "signature" / TSignature(0xEC338270),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 has_from_id=1,
                 has_channel_id=2,
                 has_channel_post=4,
@@ -2402,110 +2849,112 @@ class tblob:  # pylint: disable=C0103
                 has_saved_from_peer=16,
                 has_from_name=32,
             ),
-            "from_id" / If(this.flags.has_from_id, Int32ul),
-            "from_name" / If(this.flags.has_from_name, self.tstring_struct),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
+            "from_name" / TFlagIf("has_from_name", self.tstring_struct),
             "date" / self.ttimestamp_struct,
-            "channel_id" / If(this.flags.has_channel_id, Int32ul),
-            "channel_post" / If(this.flags.has_channel_post, Int32ul),
-            "post_author" / If(this.flags.has_post_author, self.tstring_struct),
+            "channel_id" / TFlagIf("has_channel_id", Int32ul),
+            "channel_post" / TFlagIf("has_channel_post", Int32ul),
+            "post_author" / TFlagIf("has_post_author", self.tstring_struct),
             "saved_from_peer"
-            / If(this.flags.has_saved_from_peer, self.peer_structures("saved_from_peer")),
-            "saved_from_msg_id" / If(this.flags.has_saved_from_peer, Int32ul),
+            / TFlagIf("has_saved_from_peer", self.peer_structures("saved_from_peer")),
+            "saved_from_msg_id" / TFlagIf("has_saved_from_peer", Int32ul),
         )
 
+    @cached_struct
     def message_fwd_header_layer68_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_fwd_header_layer68"),
-            "signature" / Hex(Const(0xC786DDCB, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_from_id=1, has_channel_id=2, has_channel_post=4),
-            "from_id" / If(this.flags.has_from_id, Int32ul),
+            "signature" / TSignature(0xC786DDCB),
+            "flags" / TFlags(has_from_id=1, has_channel_id=2, has_channel_post=4),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
             "date" / self.ttimestamp_struct,
-            "channel_id" / If(this.flags.has_channel_id, Int32ul),
-            "channel_post" / If(this.flags.has_channel_post, Int32ul),
+            "channel_id" / TFlagIf("has_channel_id", Int32ul),
+            "channel_post" / TFlagIf("has_channel_post", Int32ul),
         )
 
+    @cached_struct
     def message_fwd_header_layer72_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_fwd_header_layer72"),
-            "signature" / Hex(Const(0xFADFF4AC, Int32ul)),
+            "signature" / TSignature(0xFADFF4AC),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 has_from_id=1,
                 has_channel_id=2,
                 has_channel_post=4,
                 has_post_author=8,
             ),
-            "from_id" / If(this.flags.has_from_id, Int32ul),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
             "date" / self.ttimestamp_struct,
-            "channel_id" / If(this.flags.has_channel_id, Int32ul),
-            "channel_post" / If(this.flags.has_channel_post, Int32ul),
-            "post_author" / If(this.flags.has_post_author, self.tstring_struct),
+            "channel_id" / TFlagIf("has_channel_id", Int32ul),
+            "channel_post" / TFlagIf("has_channel_post", Int32ul),
+            "post_author" / TFlagIf("has_post_author", self.tstring_struct),
         )
 
+    @cached_struct
     def message_fwd_header_layer96_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_fwd_header_layer96"),
-            "signature" / Hex(Const(0x559EBE6D, Int32ul)),
+            "signature" / TSignature(0x559EBE6D),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 has_from_id=1,
                 has_channel_id=2,
                 has_channel_post=4,
                 has_post_author=8,
                 has_saved_from_peer=16,
             ),
-            "from_id" / If(this.flags.has_from_id, Int32ul),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
             "date" / self.ttimestamp_struct,
-            "channel_id" / If(this.flags.has_channel_id, Int32ul),
-            "channel_post" / If(this.flags.has_channel_post, Int32ul),
-            "post_author" / If(this.flags.has_post_author, self.tstring_struct),
+            "channel_id" / TFlagIf("has_channel_id", Int32ul),
+            "channel_post" / TFlagIf("has_channel_post", Int32ul),
+            "post_author" / TFlagIf("has_post_author", self.tstring_struct),
             "saved_from_peer"
-            / If(this.flags.has_saved_from_peer, self.peer_structures("saved_from_peer")),
-            "saved_from_msg_id" / If(this.flags.has_saved_from_peer, Int32ul),
+            / TFlagIf("has_saved_from_peer", self.peer_structures("saved_from_peer")),
+            "saved_from_msg_id" / TFlagIf("has_saved_from_peer", Int32ul),
         )
 
+    @cached_struct
     def message_fwd_header_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x353A686B: LazyBound(lambda: self.message_fwd_header_struct()),
-            0xC786DDCB: LazyBound(lambda: self.message_fwd_header_layer68_struct()),
-            0xEC338270: LazyBound(lambda: self.message_fwd_header_layer112_struct()),
-            0xFADFF4AC: LazyBound(lambda: self.message_fwd_header_layer72_struct()),
-            0x559EBE6D: LazyBound(lambda: self.message_fwd_header_layer96_struct()),
+            0x353A686B: self.message_fwd_header_struct(),
+            0xC786DDCB: self.message_fwd_header_layer68_struct(),
+            0xEC338270: self.message_fwd_header_layer112_struct(),
+            0xFADFF4AC: self.message_fwd_header_layer72_struct(),
+            0x559EBE6D: self.message_fwd_header_layer96_struct(),
         }
-        return "message_fwd_header_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "message_fwd_header_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def message_reactions_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_reactions"),
-            "signature" / Hex(Const(0xB87A24D1, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, min=1),
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "signature" / TSignature(0xB87A24D1),
+            "flags" / TFlags(min=1),
+            "_vector_sig" / self.tvector_signature,
             "reaction_count_num" / Int32ul,
-            "reaction_count_array" / Array(this.reaction_count_num, self.reaction_count_struct()),
+            "reaction_count_array" / TArray(this.reaction_count_num, self.reaction_count_struct()),
         )
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def message_media_empty_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_empty"),
-            "signature" / Hex(Const(0x3DED6320, Int32ul)),
+            "signature" / TSignature(0x3DED6320),
         )
 
+    @cached_struct
     def message_media_invoice_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_invoice"),
-            "signature" / Hex(Const(0x84551347, Int32ul)),
+            "signature" / TSignature(0x84551347),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 has_photo=1,
                 shipping_address_requested=2,
                 has_receipt_msg_id=4,
@@ -2513,70 +2962,78 @@ class tblob:  # pylint: disable=C0103
             ),
             "title" / self.tstring_struct,
             "description" / self.tstring_struct,
-            "photo" / If(this.flags.has_photo, self.web_document_structures("photo")),
-            "receipt_msg_id" / If(this.flags.has_receipt_msg_id, Int32ul),
+            "photo" / TFlagIf("has_photo", self.web_document_structures("photo")),
+            "receipt_msg_id" / TFlagIf("has_receipt_msg_id", Int32ul),
             "currency" / self.tstring_struct,
             "total_amount" / Int64ul,
             "start_param" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_media_document_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_document"),
-            "signature" / Hex(Const(0x9CB070D7, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_document=1, has_ttl_seconds=4),
-            "document" / If(this.flags.has_document, self.document_structures("document")),
-            "ttl_seconds" / If(this.flags.has_ttl_seconds, Int32ul),
+            "signature" / TSignature(0x9CB070D7),
+            "flags" / TFlags(has_document=1, has_ttl_seconds=4),
+            "document" / TFlagIf("has_document", self.document_structures("document")),
+            "ttl_seconds" / TFlagIf("has_ttl_seconds", Int32ul),
         )
 
+    @cached_struct
     def message_media_unsupported_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_unsupported"),
-            "signature" / Hex(Const(0x9F84F49E, Int32ul)),
+            "signature" / TSignature(0x9F84F49E),
         )
 
+    @cached_struct
     def message_media_video_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_video_old"),
-            "signature" / Hex(Const(0xA2D24290, Int32ul)),
+            "signature" / TSignature(0xA2D24290),
             "video_unused" / self.video_structures("video_unused"),
         )
 
+    @cached_struct
     def message_media_web_page_struct(self):
-        return "message_media_web_page" / Struct(
+        return "message_media_web_page" / TStruct(
             "sname" / Computed("message_media_web_page"),
-            "signature" / Hex(Const(0xA32DD600, Int32ul)),
+            "signature" / TSignature(0xA32DD600),
             "webpage" / self.web_page_structures("webpage"),
         )
 
+    @cached_struct
     def message_media_photo_layer74_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_photo_layer74"),
-            "signature" / Hex(Const(0xB5223B0F, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_photo=1, has_caption=2, has_ttl=4),
-            "photo" / If(this.flags.has_photo, self.photo_structures("photo")),
-            "caption_legacy" / If(this.flags.has_caption, self.tstring_struct),
-            "ttl_seconds" / If(this.flags.has_ttl, Int32ul),
+            "signature" / TSignature(0xB5223B0F),
+            "flags" / TFlags(has_photo=1, has_caption=2, has_ttl=4),
+            "photo" / TFlagIf("has_photo", self.photo_structures("photo")),
+            "caption_legacy" / TFlagIf("has_caption", self.tstring_struct),
+            "ttl_seconds" / TFlagIf("has_ttl", Int32ul),
         )
 
+    @cached_struct
     def message_media_audio_layer45_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_audio_layer45"),
-            "signature" / Hex(Const(0xC6B68300, Int32ul)),
+            "signature" / TSignature(0xC6B68300),
             "audio" / self.audio_structures("audio"),
         )
 
+    @cached_struct
     def message_media_photo_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_photo_old"),
-            "signature" / Hex(Const(0xC8C45A2A, Int32ul)),
+            "signature" / TSignature(0xC8C45A2A),
             "photo" / self.photo_structures("photo"),
         )
 
+    @cached_struct
     def message_media_contact_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_contact"),
-            "signature" / Hex(Const(0xCBF24940, Int32ul)),
+            "signature" / TSignature(0xCBF24940),
             "phone_number" / self.tstring_struct,
             "first_name" / self.tstring_struct,
             "last_name" / self.tstring_struct,
@@ -2584,32 +3041,36 @@ class tblob:  # pylint: disable=C0103
             "user_id" / Int32ul,
         )
 
+    @cached_struct
     def message_media_document_layer68_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_document_layer68"),
-            "signature" / Hex(Const(0xF3E02EA8, Int32ul)),
+            "signature" / TSignature(0xF3E02EA8),
             "document" / self.document_structures("document"),
             "caption_legacy" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_media_game_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_game"),
-            "signature" / Hex(Const(0xFDB19008, Int32ul)),
+            "signature" / TSignature(0xFDB19008),
             "game" / self.game_struct(),
         )
 
+    @cached_struct
     def message_media_unsupported_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_unsupported_old"),
-            "signature" / Hex(Const(0x29632A36, Int32ul)),
+            "signature" / TSignature(0x29632A36),
             "bytes" / self.tbytes_struct,
         )
 
+    @cached_struct
     def message_media_venue_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_venue"),
-            "signature" / Hex(Const(0x2EC0533F, Int32ul)),
+            "signature" / TSignature(0x2EC0533F),
             "geo" / self.geo_point_structures("geo"),
             "title" / self.tstring_struct,
             "address" / self.tstring_struct,
@@ -2618,81 +3079,91 @@ class tblob:  # pylint: disable=C0103
             "venue_type" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_media_document_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_document_old"),
-            "signature" / Hex(Const(0x2FDA2204, Int32ul)),
+            "signature" / TSignature(0x2FDA2204),
             "document" / self.document_structures("document"),
         )
 
+    @cached_struct
     def message_media_photo_layer68_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_photo_layer68"),
-            "signature" / Hex(Const(0x3D8CE53D, Int32ul)),
+            "signature" / TSignature(0x3D8CE53D),
             "photo" / self.photo_structures("photo"),
             "caption_legacy" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_media_poll_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_poll"),
-            "signature" / Hex(Const(0x4BD6E798, Int32ul)),
+            "signature" / TSignature(0x4BD6E798),
             "poll" / self.poll_struct(),
             "results" / self.poll_results_structures("results"),
         )
 
+    @cached_struct
     def message_media_geo_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_geo"),
-            "signature" / Hex(Const(0x56E0D474, Int32ul)),
+            "signature" / TSignature(0x56E0D474),
             "geo" / self.geo_point_structures("geo"),
         )
 
+    @cached_struct
     def message_media_video_layer45_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_video_layer45"),
-            "signature" / Hex(Const(0x5BCF1675, Int32ul)),
+            "signature" / TSignature(0x5BCF1675),
             "video_unused" / self.video_structures("video_unused"),
             "caption_legacy" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_media_contact_layer81_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_contact_layer81"),
-            "signature" / Hex(Const(0x5E7D2F39, Int32ul)),
+            "signature" / TSignature(0x5E7D2F39),
             "phone_number" / self.tstring_struct,
             "first_name" / self.tstring_struct,
             "last_name" / self.tstring_struct,
             "user_id" / Int32ul,
         )
 
+    @cached_struct
     def message_media_dice_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_dice"),
-            "signature" / Hex(Const(0x3F7EE58B, Int32ul)),
+            "signature" / TSignature(0x3F7EE58B),
             "emoticon" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_media_dice_layer111_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_dice_layer111"),
-            "signature" / Hex(Const(0x638FE46B, Int32ul)),
+            "signature" / TSignature(0x638FE46B),
             "value" / Int32ul,
         )
 
+    @cached_struct
     def message_media_photo_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_photo"),
-            "signature" / Hex(Const(0x695150D7, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_photo=1, has_ttl=4),
-            "photo" / If(this.flags.has_photo, self.photo_structures("photo")),
-            "ttl_seconds" / If(this.flags.has_ttl, Int32ul),
+            "signature" / TSignature(0x695150D7),
+            "flags" / TFlags(has_photo=1, has_ttl=4),
+            "photo" / TFlagIf("has_photo", self.photo_structures("photo")),
+            "ttl_seconds" / TFlagIf("has_ttl", Int32ul),
         )
 
+    @cached_struct
     def message_media_venue_layer71_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_venue_layer71"),
-            "signature" / Hex(Const(0x7912B71F, Int32ul)),
+            "signature" / TSignature(0x7912B71F),
             "geo" / self.geo_point_structures("geo"),
             "title" / self.tstring_struct,
             "address" / self.tstring_struct,
@@ -2700,64 +3171,66 @@ class tblob:  # pylint: disable=C0103
             "venue_id" / self.tstring_struct,
         )
 
+    @cached_struct
     def message_media_geo_live_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_geo_live"),
-            "signature" / Hex(Const(0x7C3C2609, Int32ul)),
+            "signature" / TSignature(0x7C3C2609),
             "geo" / self.geo_point_structures("geo"),
             "period" / Int32ul,
         )
 
+    @cached_struct
     def message_media_document_layer74_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_media_document_layer74"),
-            "signature" / Hex(Const(0x7C4414D3, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, has_document=1, has_caption=2, has_ttl=4),
-            "document" / If(this.flags.has_document, self.document_structures("document")),
-            "caption_legacy" / If(this.flags.has_caption, self.tstring_struct),
-            "ttl_seconds" / If(this.flags.has_ttl, Int32ul),
+            "signature" / TSignature(0x7C4414D3),
+            "flags" / TFlags(has_document=1, has_caption=2, has_ttl=4),
+            "document" / TFlagIf("has_document", self.document_structures("document")),
+            "caption_legacy" / TFlagIf("has_caption", self.tstring_struct),
+            "ttl_seconds" / TFlagIf("has_ttl", Int32ul),
         )
 
+    @cached_struct
     def message_media_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
-            0x3F7EE58B: LazyBound(lambda: self.message_media_dice_struct()),
-            0x638FE46B: LazyBound(lambda: self.message_media_dice_layer111_struct()),
-            0x3DED6320: LazyBound(lambda: self.message_media_empty_struct()),
-            0xA32DD600: LazyBound(lambda: self.message_media_web_page_struct()),
-            0x84551347: LazyBound(lambda: self.message_media_invoice_struct()),
-            0x9CB070D7: LazyBound(lambda: self.message_media_document_struct()),
-            0x9F84F49E: LazyBound(lambda: self.message_media_unsupported_struct()),
-            0xA2D24290: LazyBound(lambda: self.message_media_video_old_struct()),
-            0xB5223B0F: LazyBound(lambda: self.message_media_photo_layer74_struct()),
-            0xC6B68300: LazyBound(lambda: self.message_media_audio_layer45_struct()),
-            0xC8C45A2A: LazyBound(lambda: self.message_media_photo_old_struct()),
-            0xCBF24940: LazyBound(lambda: self.message_media_contact_struct()),
-            0xF3E02EA8: LazyBound(lambda: self.message_media_document_layer68_struct()),
-            0xFDB19008: LazyBound(lambda: self.message_media_game_struct()),
-            0x29632A36: LazyBound(lambda: self.message_media_unsupported_old_struct()),
-            0x2EC0533F: LazyBound(lambda: self.message_media_venue_struct()),
-            0x2FDA2204: LazyBound(lambda: self.message_media_document_old_struct()),
-            0x3D8CE53D: LazyBound(lambda: self.message_media_photo_layer68_struct()),
-            0x4BD6E798: LazyBound(lambda: self.message_media_poll_struct()),
-            0x56E0D474: LazyBound(lambda: self.message_media_geo_struct()),
-            0x5BCF1675: LazyBound(lambda: self.message_media_video_layer45_struct()),
-            0x5E7D2F39: LazyBound(lambda: self.message_media_contact_layer81_struct()),
-            0x695150D7: LazyBound(lambda: self.message_media_photo_struct()),
-            0x7912B71F: LazyBound(lambda: self.message_media_venue_layer71_struct()),
-            0x7C3C2609: LazyBound(lambda: self.message_media_geo_live_struct()),
-            0x7C4414D3: LazyBound(lambda: self.message_media_document_layer74_struct()),
+            0x3F7EE58B: self.message_media_dice_struct(),
+            0x638FE46B: self.message_media_dice_layer111_struct(),
+            0x3DED6320: self.message_media_empty_struct(),
+            0xA32DD600: self.message_media_web_page_struct(),
+            0x84551347: self.message_media_invoice_struct(),
+            0x9CB070D7: self.message_media_document_struct(),
+            0x9F84F49E: self.message_media_unsupported_struct(),
+            0xA2D24290: self.message_media_video_old_struct(),
+            0xB5223B0F: self.message_media_photo_layer74_struct(),
+            0xC6B68300: self.message_media_audio_layer45_struct(),
+            0xC8C45A2A: self.message_media_photo_old_struct(),
+            0xCBF24940: self.message_media_contact_struct(),
+            0xF3E02EA8: self.message_media_document_layer68_struct(),
+            0xFDB19008: self.message_media_game_struct(),
+            0x29632A36: self.message_media_unsupported_old_struct(),
+            0x2EC0533F: self.message_media_venue_struct(),
+            0x2FDA2204: self.message_media_document_old_struct(),
+            0x3D8CE53D: self.message_media_photo_layer68_struct(),
+            0x4BD6E798: self.message_media_poll_struct(),
+            0x56E0D474: self.message_media_geo_struct(),
+            0x5BCF1675: self.message_media_video_layer45_struct(),
+            0x5E7D2F39: self.message_media_contact_layer81_struct(),
+            0x695150D7: self.message_media_photo_struct(),
+            0x7912B71F: self.message_media_venue_layer71_struct(),
+            0x7C3C2609: self.message_media_geo_live_struct(),
+            0x7C4414D3: self.message_media_document_layer74_struct(),
         }
-        return "message_media_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "message_media_structures" / TSignatureSwitch(name, tag_map)
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def message_forwarded_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_forwarded_old"),
-            "signature" / Hex(Const(0x05F46804, Int32ul)),
+            "signature" / TSignature(0x05F46804),
             "id" / Int32ul,
             "fwd_from_id" / Int32ul,
             "fwd_from_date" / self.ttimestamp_struct,
@@ -2770,11 +3243,12 @@ class tblob:  # pylint: disable=C0103
             "media" / self.message_media_structures("media"),
         )
 
+    @cached_struct
     def message_forwarded_old2_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_forwarded_old2"),
-            "signature" / Hex(Const(0xA367E716, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, unread=1, out=2, mentioned=16, media_unread=32),
+            "signature" / TSignature(0xA367E716),
+            "flags" / TFlags(unread=1, out=2, mentioned=16, media_unread=32),
             "id" / Int32ul,
             "fwd_from_id" / Int32ul,
             "fwd_from_date" / Int32ul,
@@ -2785,13 +3259,13 @@ class tblob:  # pylint: disable=C0103
             "media" / self.message_media_structures("media"),
         )
 
+    @cached_struct
     def message_old3_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_old3"),
-            "signature" / Hex(Const(0xA7AB1991, Int32ul)),
+            "signature" / TSignature(0xA7AB1991),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 unread=1,
                 out=2,
                 is_forwarded=4,
@@ -2802,21 +3276,21 @@ class tblob:  # pylint: disable=C0103
             "id" / Int32ul,
             "from_id" / Int32ul,
             "to_id" / self.peer_structures("to_id"),
-            "fwd_from_id" / If(this.flags.is_forwarded, Int32ul),
-            "fwd_from_date" / If(this.flags.is_forwarded, Int32ul),
-            "reply_to_msg_id" / If(this.flags.is_reply_to_msg_id, Int32ul),
+            "fwd_from_id" / TFlagIf("is_forwarded", Int32ul),
+            "fwd_from_date" / TFlagIf("is_forwarded", Int32ul),
+            "reply_to_msg_id" / TFlagIf("is_reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
             "media" / self.message_media_structures("media"),
         )
 
+    @cached_struct
     def message_service_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_service"),
-            "signature" / Hex(Const(0x9E19A1F6, Int32ul)),
+            "signature" / TSignature(0x9E19A1F6),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 unread=1,
                 out=2,
                 is_reply_to_msg_id=8,
@@ -2828,17 +3302,18 @@ class tblob:  # pylint: disable=C0103
                 is_grouped_id=131072,
             ),
             "id" / Int32ul,
-            "from_id" / If(this.flags.has_from_id, Int32ul),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
             "to_id" / self.peer_structures("to_id"),
-            "reply_to_msg_id" / If(this.flags.is_reply_to_msg_id, Int32ul),
+            "reply_to_msg_id" / TFlagIf("is_reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "action" / self.message_action_structures("action"),
         )
 
+    @cached_struct
     def message_service_old_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_service_old"),
-            "signature" / Hex(Const(0x9F8D60BB, Int32ul)),
+            "signature" / TSignature(0x9F8D60BB),
             "id" / Int32ul,
             "from_id" / Int32ul,
             "to_id" / self.peer_structures("to_id"),
@@ -2848,13 +3323,13 @@ class tblob:  # pylint: disable=C0103
             "action" / self.message_action_structures("action"),
         )
 
+    @cached_struct
     def message_secret_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_secret"),
-            "signature" / Hex(Const(0x555555FA, Int32ul)),
+            "signature" / TSignature(0x555555FA),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 unread=1,
                 out=2,
                 is_reply_to_random_id=8,
@@ -2870,26 +3345,23 @@ class tblob:  # pylint: disable=C0103
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
             "media" / self.message_media_structures("media"),
-            "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            "_vector_sig" / self.tvector_signature,
             "message_entity_num" / Int32ul,
             "message_entity_array"
-            / Array(
-                this.message_entity_num,
-                self.message_entity_structures("message_entity"),
-            ),
-            "via_bot_name" / If(this.flags.has_via_bot_name, self.tstring_struct),
-            "reply_to_random_id" / If(this.flags.is_reply_to_random_id, Int64ul),
-            "grouped_id" / If(this.flags.has_grouped_id, Int64ul),
+            / TArray(this.message_entity_num, self.message_entity_structures("message_entity")),
+            "via_bot_name" / TFlagIf("has_via_bot_name", self.tstring_struct),
+            "reply_to_random_id" / TFlagIf("is_reply_to_random_id", Int64ul),
+            "grouped_id" / TFlagIf("has_grouped_id", Int64ul),
             "UNPARSED" / GreedyBytes,
         )
 
+    @cached_struct
     def message_layer72_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_layer72"),
-            "signature" / Hex(Const(0x90DDDC11, Int32ul)),
+            "signature" / TSignature(0x90DDDC11),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 out=2,
                 forwarded=4,
                 is_reply_to_msg_id=8,
@@ -2907,48 +3379,36 @@ class tblob:  # pylint: disable=C0103
                 has_author=65536,
             ),
             "id" / Int32ul,
-            "from_id" / If(this.flags.has_from_id, Int32ul),
-            "to_id_type" / FlagsEnum(Int32ul, channel=0xBDDDE532, chat=0xBAD0E5BB, user=0x9DB1BC6D),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
+            "to_id_type" / TFlags(channel=0xBDDDE532, chat=0xBAD0E5BB, user=0x9DB1BC6D),
             "to_id" / Int32ul,
-            "fwd_from" / If(this.flags.forwarded, self.message_fwd_header_structures("fwd_from")),
-            "via_bot_id" / If(this.flags.is_via_bot, Int32ul),
-            "reply_to_msg_id" / If(this.flags.is_reply_to_msg_id, Int32ul),
+            "fwd_from" / TFlagIf("forwarded", self.message_fwd_header_structures("fwd_from")),
+            "via_bot_id" / TFlagIf("is_via_bot", Int32ul),
+            "reply_to_msg_id" / TFlagIf("is_reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
-            "media" / If(this.flags.has_media, self.message_media_structures("media")),
+            "media" / TFlagIf("has_media", self.message_media_structures("media")),
             # The following two fields are copied from media, ignored.
             "_media_ttl" / Computed("ignored"),
             "_media_caption_legacy" / Computed("ignored"),
             "reply_markup"
-            / If(
-                this.flags.has_reply_markup,
+            / TFlagIf(
+                "has_reply_markup",
                 self.reply_markup_structures("reply_markup"),
             ),
-            "entities"
-            / If(
-                this.flags.has_entities,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "message_entity_num" / Int32ul,
-                    "message_entity_array"
-                    / Array(
-                        this.message_entity_num,
-                        self.message_entity_structures("message_entity"),
-                    ),
-                ),
-            ),
-            "views" / If(this.flags.has_views, Int32ul),
-            "edit_timestamp" / If(this.flags.is_edited, Int32ul),
-            "post_author" / If(this.flags.has_author, Int32ul),
+            "entities" / TFlagIf("has_entities", self.message_entities_struct()),
+            "views" / TFlagIf("has_views", Int32ul),
+            "edit_timestamp" / TFlagIf("is_edited", Int32ul),
+            "post_author" / TFlagIf("has_author", Int32ul),
         )
 
+    @cached_struct
     def message_service_layer48_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_service_layer48"),
-            "signature" / Hex(Const(0xC06B9607, Int32ul)),
+            "signature" / TSignature(0xC06B9607),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 unread=1,
                 out=2,
                 mentioned=16,
@@ -2960,7 +3420,7 @@ class tblob:  # pylint: disable=C0103
                 is_grouped_id=131072,
             ),
             "id" / Int32ul,
-            "from_id" / If(this.flags.has_from_id, Int32ul),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
             "to_id" / self.peer_structures("to_id"),
             "from_id_adjusted"
             / If(
@@ -2975,13 +3435,13 @@ class tblob:  # pylint: disable=C0103
             "action" / self.message_action_structures("action"),
         )
 
+    @cached_struct
     def message_layer68_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_layer68"),
-            "signature" / Hex(Const(0xC09BE45F, Int32ul)),
+            "signature" / TSignature(0xC09BE45F),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 unread=1,
                 out=2,
                 forwarded=4,
@@ -3000,7 +3460,7 @@ class tblob:  # pylint: disable=C0103
                 with_my_score=1073741824,
             ),
             "id" / Int32ul,
-            "from_id" / If(this.flags.has_from_id, Int32ul),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
             "to_id" / self.peer_structures("to_id"),
             "from_id_adjusted"
             / If(
@@ -3011,44 +3471,32 @@ class tblob:  # pylint: disable=C0103
                     "from_id_adjusted" / this.to_id.channel_id * -1,
                 ),
             ),
-            "fwd_from" / If(this.flags.forwarded, self.message_fwd_header_structures("fwd_from")),
-            "via_bot_id" / If(this.flags.is_via_bot, Int32ul),
-            "reply_to_msg_id" / If(this.flags.is_reply_to_msg_id, Int32ul),
+            "fwd_from" / TFlagIf("forwarded", self.message_fwd_header_structures("fwd_from")),
+            "via_bot_id" / TFlagIf("is_via_bot", Int32ul),
+            "reply_to_msg_id" / TFlagIf("is_reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
-            "media" / If(this.flags.has_media, self.message_media_structures("media")),
+            "media" / TFlagIf("has_media", self.message_media_structures("media")),
             # The following two fields are copied from media, ignored.
             "_media_ttl" / Computed("ignored"),
             "_media_caption_legacy" / Computed("ignored"),
             "reply_markup"
-            / If(
-                this.flags.has_reply_markup,
+            / TFlagIf(
+                "has_reply_markup",
                 self.reply_markup_structures("reply_markup"),
             ),
-            "entities"
-            / If(
-                this.flags.has_entities,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "message_entity_num" / Int32ul,
-                    "message_entity_array"
-                    / Array(
-                        this.message_entity_num,
-                        self.message_entity_structures("message_entity"),
-                    ),
-                ),
-            ),
-            "views" / If(this.flags.has_views, Int32ul),
-            "edit_timestamp" / If(this.flags.is_edited, Int32ul),
+            "entities" / TFlagIf("has_entities", self.message_entities_struct()),
+            "views" / TFlagIf("has_views", Int32ul),
+            "edit_timestamp" / TFlagIf("is_edited", Int32ul),
         )
 
+    @cached_struct
     def message_old4_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_old4"),
-            "signature" / Hex(Const(0xC3060325, Int32ul)),
+            "signature" / TSignature(0xC3060325),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 unread=1,
                 out=2,
                 forwarded=4,
@@ -3061,42 +3509,30 @@ class tblob:  # pylint: disable=C0103
             "id" / Int32ul,
             "from_id" / Int32ul,
             "to_id" / self.peer_structures("to_id"),
-            "fwd_from_id" / If(this.flags.forwarded, "fwd_from_id" / Int32ul),
+            "fwd_from_id" / TFlagIf("forwarded", "fwd_from_id" / Int32ul),
             "fwd_from_timestamp"
-            / If(this.flags.forwarded, "fwd_from_timestamp" / self.ttimestamp_struct),
-            "reply_to_msg_id" / If(this.flags.is_reply_to_msg_id, Int32ul),
+            / TFlagIf("forwarded", "fwd_from_timestamp" / self.ttimestamp_struct),
+            "reply_to_msg_id" / TFlagIf("is_reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
             "media" / self.message_media_structures("media"),
             # The following field is copied from media, ignored.
             "_media_caption_legacy" / Computed("ignored"),
             "reply_markup"
-            / If(
-                this.flags.has_reply_markup,
+            / TFlagIf(
+                "has_reply_markup",
                 self.reply_markup_structures("reply_markup"),
             ),
-            "entities"
-            / If(
-                this.flags.has_entities,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "message_entity_num" / Int32ul,
-                    "message_entity_array"
-                    / Array(
-                        this.message_entity_num,
-                        self.message_entity_structures("message_entity"),
-                    ),
-                ),
-            ),
+            "entities" / TFlagIf("has_entities", self.message_entities_struct()),
         )
 
+    @cached_struct
     def message_old5_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_old5"),
-            "signature" / Hex(Const(0xF07814C8, Int32ul)),
+            "signature" / TSignature(0xF07814C8),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 unread=1,
                 out=2,
                 forwarded=4,
@@ -3109,45 +3545,33 @@ class tblob:  # pylint: disable=C0103
             "id" / Int32ul,
             "from_id" / Int32ul,
             "to_id" / self.peer_structures("to_id"),
-            "fwd_from_id" / If(this.flags.forwarded, "fwd_from_id" / Int32ul),
+            "fwd_from_id" / TFlagIf("forwarded", "fwd_from_id" / Int32ul),
             "fwd_from_timestamp"
-            / If(this.flags.forwarded, "fwd_from_timestamp" / self.ttimestamp_struct),
-            "reply_to_msg_id" / If(this.flags.is_reply_to_msg_id, Int32ul),
+            / TFlagIf("forwarded", "fwd_from_timestamp" / self.ttimestamp_struct),
+            "reply_to_msg_id" / TFlagIf("is_reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
-            "media" / If(this.flags.has_media, self.message_media_structures("media")),
+            "media" / TFlagIf("has_media", self.message_media_structures("media")),
             # Thee following two fields are copied from media, ignored.
             "_media_ttl" / Computed("ignored"),
             "_media_caption_legacy" / Computed("ignored"),
             "reply_markup"
-            / If(
-                this.flags.has_reply_markup,
+            / TFlagIf(
+                "has_reply_markup",
                 self.reply_markup_structures("reply_markup"),
             ),
-            "entities"
-            / If(
-                this.flags.has_entities,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "message_entity_num" / Int32ul,
-                    "message_entity_array"
-                    / Array(
-                        this.message_entity_num,
-                        self.message_entity_structures("message_entity"),
-                    ),
-                ),
-            ),
-            "views" / If(this.flags.has_views, Int32ul),
-            "edit_timestamp" / If(this.flags.is_edited, Int32ul),
+            "entities" / TFlagIf("has_entities", self.message_entities_struct()),
+            "views" / TFlagIf("has_views", Int32ul),
+            "edit_timestamp" / TFlagIf("is_edited", Int32ul),
         )
 
+    @cached_struct
     def message_layer104_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_layer104"),
-            "signature" / Hex(Const(0x44F9B43D, Int32ul)),
+            "signature" / TSignature(0x44F9B43D),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 out=2,
                 forwarded=4,
                 is_reply_to_msg_id=8,
@@ -3166,49 +3590,37 @@ class tblob:  # pylint: disable=C0103
                 is_grouped_id=131072,
             ),
             "id" / Int32ul,
-            "from_id" / If(this.flags.has_from_id, Int32ul),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
             "to_id" / self.peer_structures("to_id"),
-            "fwd_from" / If(this.flags.forwarded, self.message_fwd_header_structures("fwd_from")),
-            "via_bot_id" / If(this.flags.is_via_bot, Int32ul),
-            "reply_to_msg_id" / If(this.flags.is_reply_to_msg_id, Int32ul),
+            "fwd_from" / TFlagIf("forwarded", self.message_fwd_header_structures("fwd_from")),
+            "via_bot_id" / TFlagIf("is_via_bot", Int32ul),
+            "reply_to_msg_id" / TFlagIf("is_reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
-            "media" / If(this.flags.has_media, self.message_media_structures("media")),
+            "media" / TFlagIf("has_media", self.message_media_structures("media")),
             # The following two fields are copied from media, ignored.
             "_media_ttl" / Computed("ignored"),
             "_media_caption_legacy" / Computed("ignored"),
             "reply_markup"
-            / If(
-                this.flags.has_reply_markup,
+            / TFlagIf(
+                "has_reply_markup",
                 self.reply_markup_structures("reply_markup"),
             ),
-            "entities"
-            / If(
-                this.flags.has_entities,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "message_entity_num" / Int32ul,
-                    "message_entity_array"
-                    / Array(
-                        this.message_entity_num,
-                        self.message_entity_structures("message_entity"),
-                    ),
-                ),
-            ),
-            "views" / If(this.flags.has_views, Int32ul),
-            "edit_timestamp" / If(this.flags.is_edited, Int32ul),
-            "post_author" / If(this.flags.has_author, self.tstring_struct),
-            "grouped_id" / If(this.flags.is_grouped_id, Int64ul),
+            "entities" / TFlagIf("has_entities", self.message_entities_struct()),
+            "views" / TFlagIf("has_views", Int32ul),
+            "edit_timestamp" / TFlagIf("is_edited", Int32ul),
+            "post_author" / TFlagIf("has_author", self.tstring_struct),
+            "grouped_id" / TFlagIf("is_grouped_id", Int64ul),
             "UNPARSED" / GreedyBytes,
         )
 
+    @cached_struct
     def message_layer104_2_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_layer104_2"),
-            "signature" / Hex(Const(0x1C9B1027, Int32ul)),
+            "signature" / TSignature(0x1C9B1027),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 out=2,
                 forwarded=4,
                 reply_to_msg_id=8,
@@ -3231,47 +3643,34 @@ class tblob:  # pylint: disable=C0103
                 restricted=4194304,
             ),
             "id" / Int32ul,
-            "from_id" / If(this.flags.from_id, Int32ul),
+            "from_id" / TFlagIf("from_id", Int32ul),
             "to_id" / self.peer_structures("to_id"),
-            "fwd_from" / If(this.flags.forwarded, self.message_fwd_header_structures("fwd_from")),
-            "via_bot_id" / If(this.flags.via_bot, Int32ul),
-            "reply_to_msg_id" / If(this.flags.reply_to_msg_id, Int32ul),
+            "fwd_from" / TFlagIf("forwarded", self.message_fwd_header_structures("fwd_from")),
+            "via_bot_id" / TFlagIf("via_bot", Int32ul),
+            "reply_to_msg_id" / TFlagIf("reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
-            "media" / If(this.flags.media, self.message_media_structures("media")),
+            "media" / TFlagIf("media", self.message_media_structures("media")),
             "_media_ttl" / Computed("ignored"),
             "_media_caption_legacy" / Computed("ignored"),
-            "reply_markup"
-            / If(this.flags.reply_markup, self.reply_markup_structures("reply_markup")),
-            "entities"
-            / If(
-                this.flags.entities,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "message_entity_num" / Int32ul,
-                    "message_entity_array"
-                    / Array(
-                        this.message_entity_num,
-                        self.message_entity_structures("message_entity"),
-                    ),
-                ),
-            ),
-            "views" / If(this.flags.views, Int32ul),
-            "edit_timestamp" / If(this.flags.is_edited, self.ttimestamp_struct),
-            "post_author" / If(this.flags.author, self.tstring_struct),
-            "grouped_id" / If(this.flags.grouped_id, Int64ul),
-            "reactions" / If(this.flags.reactions, self.message_reactions_struct()),
-            "restricted" / If(this.flags.restricted, self.tstring_struct),
+            "reply_markup" / TFlagIf("reply_markup", self.reply_markup_structures("reply_markup")),
+            "entities" / TFlagIf("entities", self.message_entities_struct()),
+            "views" / TFlagIf("views", Int32ul),
+            "edit_timestamp" / TFlagIf("is_edited", self.ttimestamp_struct),
+            "post_author" / TFlagIf("author", self.tstring_struct),
+            "grouped_id" / TFlagIf("grouped_id", Int64ul),
+            "reactions" / TFlagIf("reactions", self.message_reactions_struct()),
+            "restricted" / TFlagIf("restricted", self.tstring_struct),
             "UNPARSED" / GreedyBytes,
         )
 
+    @cached_struct
     def message_layer104_3_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_layer104_3"),
-            "signature" / Hex(Const(0x9789DAC4, Int32ul)),
+            "signature" / TSignature(0x9789DAC4),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 out=2,
                 forwarded=4,
                 reply_to_msg_id=8,
@@ -3294,56 +3693,43 @@ class tblob:  # pylint: disable=C0103
                 restricted=4194304,
             ),
             "id" / Int32ul,
-            "from_id" / If(this.flags.from_id, Int32ul),
+            "from_id" / TFlagIf("from_id", Int32ul),
             "to_id" / self.peer_structures("to_id"),
-            "fwd_from" / If(this.flags.forwarded, self.message_fwd_header_structures("fwd_from")),
-            "via_bot_id" / If(this.flags.via_bot, Int32ul),
-            "reply_to_msg_id" / If(this.flags.reply_to_msg_id, Int32ul),
+            "fwd_from" / TFlagIf("forwarded", self.message_fwd_header_structures("fwd_from")),
+            "via_bot_id" / TFlagIf("via_bot", Int32ul),
+            "reply_to_msg_id" / TFlagIf("reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
-            "media" / If(this.flags.media, self.message_media_structures("media")),
+            "media" / TFlagIf("media", self.message_media_structures("media")),
             "_media_ttl" / Computed("ignored"),
             "_media_caption_legacy" / Computed("ignored"),
-            "reply_markup"
-            / If(this.flags.reply_markup, self.reply_markup_structures("reply_markup")),
-            "entities"
-            / If(
-                this.flags.entities,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "message_entity_num" / Int32ul,
-                    "message_entity_array"
-                    / Array(
-                        this.message_entity_num,
-                        self.message_entity_structures("message_entity"),
-                    ),
-                ),
-            ),
-            "views" / If(this.flags.views, Int32ul),
-            "edit_timestamp" / If(this.flags.is_edited, self.ttimestamp_struct),
-            "post_author" / If(this.flags.author, self.tstring_struct),
-            "grouped_id" / If(this.flags.grouped_id, Int64ul),
-            "reactions" / If(this.flags.reactions, self.message_reactions_struct()),
+            "reply_markup" / TFlagIf("reply_markup", self.reply_markup_structures("reply_markup")),
+            "entities" / TFlagIf("entities", self.message_entities_struct()),
+            "views" / TFlagIf("views", Int32ul),
+            "edit_timestamp" / TFlagIf("is_edited", self.ttimestamp_struct),
+            "post_author" / TFlagIf("author", self.tstring_struct),
+            "grouped_id" / TFlagIf("grouped_id", Int64ul),
+            "reactions" / TFlagIf("reactions", self.message_reactions_struct()),
             "restricted"
-            / If(
-                this.flags.restricted,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            / TFlagIf(
+                "restricted",
+                TStruct(
+                    "_vector_sig" / self.tvector_signature,
                     "restricted_reasons_num" / Int32ul,
                     "restricted_reasons_array"
-                    / Array(this.restricted_reasons_num, self.restriction_reason_struct()),
+                    / TArray(this.restricted_reasons_num, self.restriction_reason_struct()),
                 ),
             ),
             "UNPARSED" / GreedyBytes,
         )
 
+    @cached_struct
     def message_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("message_struct"),
-            "signature" / Hex(Const(0x452C0E65, Int32ul)),
+            "signature" / TSignature(0x452C0E65),
             "flags"
-            / FlagsEnum(
-                Int32ul,
+            / TFlags(
                 out=2,
                 forwarded=4,
                 is_reply_to_msg_id=8,
@@ -3366,52 +3752,41 @@ class tblob:  # pylint: disable=C0103
                 is_edit_hide=2097152,
             ),
             "id" / Int32ul,
-            "from_id" / If(this.flags.has_from_id, Int32ul),
+            "from_id" / TFlagIf("has_from_id", Int32ul),
             "to_id" / self.peer_structures("to_id"),
-            "fwd_from" / If(this.flags.forwarded, self.message_fwd_header_structures("fwd_from")),
-            "via_bot_id" / If(this.flags.is_via_bot, Int32ul),
-            "reply_to_msg_id" / If(this.flags.is_reply_to_msg_id, Int32ul),
+            "fwd_from" / TFlagIf("forwarded", self.message_fwd_header_structures("fwd_from")),
+            "via_bot_id" / TFlagIf("is_via_bot", Int32ul),
+            "reply_to_msg_id" / TFlagIf("is_reply_to_msg_id", Int32ul),
             "date" / self.ttimestamp_struct,
             "message" / self.tstring_struct,
-            "media" / If(this.flags.has_media, self.message_media_structures("media")),
+            "media" / TFlagIf("has_media", self.message_media_structures("media")),
             # The following two fields are copied from media, ignored.
             "_media_ttl" / Computed("ignored"),
             "_media_caption_legacy" / Computed("ignored"),
             "reply_markup"
-            / If(
-                this.flags.has_reply_markup,
+            / TFlagIf(
+                "has_reply_markup",
                 self.reply_markup_structures("reply_markup"),
             ),
-            "entities"
-            / If(
-                this.flags.has_entities,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
-                    "message_entity_num" / Int32ul,
-                    "message_entity_array"
-                    / Array(
-                        this.message_entity_num,
-                        self.message_entity_structures("message_entity"),
-                    ),
-                ),
-            ),
-            "views" / If(this.flags.has_views, Int32ul),
-            "edit_timestamp" / If(this.flags.is_edited, self.ttimestamp_struct),
-            "post_author" / If(this.flags.has_author, self.tstring_struct),
-            "grouped_id" / If(this.flags.is_grouped_id, Int64ul),
+            "entities" / TFlagIf("has_entities", self.message_entities_struct()),
+            "views" / TFlagIf("has_views", Int32ul),
+            "edit_timestamp" / TFlagIf("is_edited", self.ttimestamp_struct),
+            "post_author" / TFlagIf("has_author", self.tstring_struct),
+            "grouped_id" / TFlagIf("is_grouped_id", Int64ul),
             "restriction_reasons"
-            / If(
-                this.flags.is_restricted,
-                Struct(
-                    "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
+            / TFlagIf(
+                "is_restricted",
+                TStruct(
+                    "_vector_sig" / self.tvector_signature,
                     "restriction_reasons_num" / Int32ul,
                     "restriction_reasons_array"
-                    / Array(this.restriction_reasons_num, self.restriction_reason_struct()),
+                    / TArray(this.restriction_reasons_num, self.restriction_reason_struct()),
                 ),
             ),
             "UNPARSED" / GreedyBytes,
         )
 
+    @cached_struct
     def message_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -3432,9 +3807,7 @@ class tblob:  # pylint: disable=C0103
             0xF07814C8: LazyBound(lambda: self.message_old5_struct()),
             0x555555FA: LazyBound(lambda: self.message_secret_struct()),
         }
-        return "message_structures" / Struct(
-            "_signature" / Peek(Int32ul), name / Switch(this._signature, tag_map)
-        )
+        return "message_structures" / TSignatureSwitch(name, tag_map)
 
     """
     TODO not yet implemented
@@ -4151,6 +4524,7 @@ class tblob:  # pylint: disable=C0103
             "user_id" / Int32ul,
         )
 
+    @cached_struct
     def peer_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -4321,6 +4695,7 @@ class tblob:  # pylint: disable=C0103
             "duration" / If(this.flags.has_duration, Int32ul),
         )
 
+    @cached_struct
     def phone_call_discard_reason_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -4511,6 +4886,7 @@ class tblob:  # pylint: disable=C0103
             "dc_id" / Int32ul,
         )
 
+    @cached_struct
     def photo_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -4657,7 +5033,7 @@ class tblob:  # pylint: disable=C0103
                 Struct(
                     "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
                     "poll_answer_voters_num" / Int32ul,
-                    "poll_answer_voters_array" / Array(this.poll_answer_voters_num, Int32ul),
+                    "poll_answer_voters_array" / TIntArray(this.poll_answer_voters_num, Int32ul),
                 ),
             ),
         )
@@ -4685,7 +5061,7 @@ class tblob:  # pylint: disable=C0103
                 Struct(
                     "_vector_sig" / Hex(Const(0x1CB5C415, Int32ul)),
                     "poll_answer_voters_num" / Int32ul,
-                    "poll_answer_voters_array" / Array(this.poll_answer_voters_num, Int32ul),
+                    "poll_answer_voters_array" / TIntArray(this.poll_answer_voters_num, Int32ul),
                 ),
             ),
             "solution" / If(this.flags.has_solution, self.tstring_struct),
@@ -4704,6 +5080,7 @@ class tblob:  # pylint: disable=C0103
             ),
         )
 
+    @cached_struct
     def poll_results_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -4717,11 +5094,12 @@ class tblob:  # pylint: disable=C0103
 
     # --------------------------------------------------------------------------
 
+    @cached_struct
     def reaction_count_struct(self):
-        return Struct(
+        return TStruct(
             "sname" / Computed("reaction_count"),
-            "signature" / Hex(Const(0x6FB250D1, Int32ul)),
-            "flags" / FlagsEnum(Int32ul, chosen=1),
+            "signature" / TSignature(0x6FB250D1),
+            "flags" / TFlags(chosen=1),
             "reaction" / self.tstring_struct,
             "count" / Int32ul,
         )
@@ -4763,6 +5141,7 @@ class tblob:  # pylint: disable=C0103
             / Array(this.keyboard_button_rows_num, self.keyboard_button_row_struct()),
         )
 
+    @cached_struct
     def reply_markup_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -5000,6 +5379,7 @@ class tblob:  # pylint: disable=C0103
             "signature" / Hex(Const(0x3DAC6A00, Int32ul)),
         )
 
+    @cached_struct
     def secure_value_type_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -5734,6 +6114,7 @@ class tblob:  # pylint: disable=C0103
             "dc_id" / Int32ul,
         )
 
+    @cached_struct
     def user_profile_photo_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -5896,6 +6277,7 @@ class tblob:  # pylint: disable=C0103
             "h" / Int32ul,
         )
 
+    @cached_struct
     def video_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -6092,6 +6474,7 @@ class tblob:  # pylint: disable=C0103
             ),
         )
 
+    @cached_struct
     def web_document_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -6368,6 +6751,7 @@ class tblob:  # pylint: disable=C0103
             ),
         )
 
+    @cached_struct
     def web_page_structures(self, name):
         # pylint: disable=C0301
         tag_map = {
@@ -9289,3 +9673,19 @@ class tblob:  # pylint: disable=C0103
 
 
 # -----------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Worker processes entry points, see tblob.parse_blobs.
+
+_worker_blob_parser = None
+
+
+def _init_worker(log_level):
+    global _worker_blob_parser  # pylint: disable=W0603
+    logger.configure_logging_level(log_level)
+    _worker_blob_parser = tblob()
+
+
+def _parse_blob_worker(data):
+    return _worker_blob_parser.parse_blob(data)
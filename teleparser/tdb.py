@@ -46,9 +46,21 @@ TYPE_MSG_TO_CHANNEL = "channel"
 TYPE_MSG_TO_USER = "chat"
 TYPE_USER_STATUS_UPDATE = "user_status_update"
 
+# Number of rows fetched from sqlite per call, see tdb.__iter_entries.
+FETCH_BATCH_SIZE = 4096
+
+# Output files are written through a large buffer, see open_output_file.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 # ------------------------------------------------------------------------------
 
 
+def open_output_file(outdir, filename):
+    return open(
+        os.path.join(outdir, filename), mode="w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE
+    )
+
+
 def escape_csv_string(instr):
     if instr:
         instr = instr.strip("\"'")
@@ -92,6 +104,32 @@ class tdb:
         entries = self._sqlite_db_cursor.fetchall()
         self._table_names = [re[0].decode("utf-8") for re in entries]
 
+    def __iter_entries(self):
+        """Iterates the rows of the last executed query, fetched in batches"""
+        while True:
+            entries = self._sqlite_db_cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not entries:
+                break
+            yield from entries
+
+    def __iter_entries_blobs(self, column, key):
+        """Iterates the rows of the last executed query along with their
+        parsed column blob. Blobs are parsed a batch at a time, which lets
+        the blob parser spread them across its worker processes. A blob
+        failing to parse is reported with the key of its own row."""
+        while True:
+            entries = self._sqlite_db_cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not entries:
+                break
+            blobs = iter(self._blob_parser.parse_blobs([entry[column] for entry in entries]))
+            for entry in entries:
+                try:
+                    blob = next(blobs)
+                except Exception:
+                    logger.error("failed parsing %s blob, entry %s: %s", column, key, entry[key])
+                    raise
+                yield entry, blob
+
     def __parse_table_chats(self):
         chats_re = "messages(_v[0-7])?"
 
@@ -99,17 +137,15 @@ class tdb:
         table_name = list(filter(r.fullmatch, self._table_names))[0]  # Read Note below
 
         self._sqlite_db_cursor.execute(f"SELECT * from {table_name}")
-        entries = self._sqlite_db_cursor.fetchall()
-
-        for entry in entries:
+        # database in version 7.0.0 doesn't have the name column
+        has_name = any(column[0] == "name" for column in self._sqlite_db_cursor.description)
+        for entry, blob in self.__iter_entries_blobs("data", "uid"):
             uid = int(entry["uid"])
             assert uid
             # check if uid found in contacts is user
             # assert uid not in self._table_chats
             logger.info("parsing chats, entry uid: %s", uid)
-            blob = self._blob_parser.parse_blob(entry["data"])
-            # database in version 7.0.0 doesn't have this entry
-            if "name" in list(entry.keys()):
+            if has_name:
                 chat = tchat(uid, entry["name"], blob)
             else:
                 # TODO: retrieve name from new(?) contacts database.
@@ -117,7 +153,7 @@ class tdb:
             self._table_chats[uid] = chat
 
     def __save_table_chats(self, outdir):
-        with open(os.path.join(outdir, "table_chats.txt"), mode="w", encoding="utf-8") as fo:
+        with open_output_file(outdir, "table_chats.txt") as fo:
             for uid, chat in self._table_chats.items():
                 fo.write("-" * 80)
                 fo.write("\nuid: {} name: {}\n\n".format(uid, chat.name))
@@ -125,9 +161,7 @@ class tdb:
 
     def __parse_table_contacts(self):
         self._sqlite_db_cursor.execute("SELECT * from contacts")
-        entries = self._sqlite_db_cursor.fetchall()
-
-        for entry in entries:
+        for entry in self.__iter_entries():
             uid = int(entry["uid"])
             assert uid
             assert uid not in self._table_contacts
@@ -135,7 +169,7 @@ class tdb:
             self._table_contacts[uid] = int(entry["mutual"])
 
     def __save_table_contacts(self, outdir):
-        with open(os.path.join(outdir, "table_contacts.txt"), mode="w", encoding="utf-8") as fo:
+        with open_output_file(outdir, "table_contacts.txt") as fo:
             for uid, mutual in self._table_contacts.items():
                 fo.write("-" * 80)
                 fo.write("\nuid: {} mutual: {}\n".format(uid, mutual))
@@ -146,9 +180,7 @@ class tdb:
 
     def __parse_table_dialogs(self):
         self._sqlite_db_cursor.execute("SELECT * from dialogs")
-        entries = self._sqlite_db_cursor.fetchall()
-
-        for entry in entries:
+        for entry in self.__iter_entries():
             did = int(entry["did"])
             assert did
             assert did not in self._table_dialogs
@@ -170,7 +202,7 @@ class tdb:
             self._table_dialogs[did] = dialog
 
     def __save_table_dialogs(self, outdir):
-        with open(os.path.join(outdir, "table_dialogs.txt"), mode="w", encoding="utf-8") as fo:
+        with open_output_file(outdir, "table_dialogs.txt") as fo:
             for did, dialog in self._table_dialogs.items():
                 fo.write("-" * 80)
                 date_string = to_date(dialog.date)
@@ -198,9 +230,7 @@ class tdb:
 
     def __parse_table_enc_chats(self):
         self._sqlite_db_cursor.execute("SELECT * from enc_chats")
-        entries = self._sqlite_db_cursor.fetchall()
-
-        for entry in entries:
+        for entry in self.__iter_entries():
             uid = int(entry["uid"])
             assert uid
             assert uid not in self._table_enc_chats
@@ -244,7 +274,7 @@ class tdb:
             self._table_enc_chats[uid] = tec
 
     def __save_table_enc_chats(self, outdir):
-        with open(os.path.join(outdir, "table_enc_chats.txt"), mode="w", encoding="utf-8") as fo:
+        with open_output_file(outdir, "table_enc_chats.txt") as fo:
             for uid, tec in self._table_enc_chats.items():
                 assert uid == tec.uid
                 fo.write("-" * 80)
@@ -278,19 +308,16 @@ class tdb:
 
     def __parse_table_media_v2(self):
         self._sqlite_db_cursor.execute("SELECT * from media_v2")
-        entries = self._sqlite_db_cursor.fetchall()
-
-        for entry in entries:
+        for entry, blob in self.__iter_entries_blobs("data", "mid"):
             mid = int(entry["mid"])
             assert mid
             assert mid not in self._table_media
             logger.info("parsing media_v2, entry mid: %s", mid)
-            blob = self._blob_parser.parse_blob(entry["data"])
             media = tmedia(mid, entry["uid"], entry["date"], entry["type"], blob)
             self._table_media[mid] = media
 
     def __save_table_media_v2(self, outdir):
-        with open(os.path.join(outdir, "table_media_v2.txt"), mode="w", encoding="utf-8") as fo:
+        with open_output_file(outdir, "table_media_v2.txt") as fo:
             for mid, media in self._table_media.items():
                 fo.write("-" * 80)
                 date_string = to_date(media.date)
@@ -307,16 +334,38 @@ class tdb:
                     fo.write("User uid missing in [users]\n\n")
                 fo.write("{}\n\n".format(media.blob))
 
-    def __parse_table_messages(self):
-        self._sqlite_db_cursor.execute("SELECT * from messages")
-        entries = self._sqlite_db_cursor.fetchall()
+    def __iter_messages(self):
+        """Iterates the messages rows along with their parsed data blob"""
+        # Python >= 3.11 exposes sqlite incremental blob I/O: message blobs
+        # are then parsed straight from the database instead of being
+        # materialized in the rows. Blobs parsed by worker processes have to
+        # be sent to them as bytes instead.
+        db_connection = self._sqlite_db_cursor.connection
+        if self._blob_parser.workers > 1:
+            self._sqlite_db_cursor.execute("SELECT * from messages")
+            yield from self.__iter_entries_blobs("data", "mid")
+        elif hasattr(db_connection, "blobopen"):
+            self._sqlite_db_cursor.execute(
+                "SELECT rowid AS data_rowid, mid, uid, read_state, send_state, date, "
+                "out, ttl, media, replydata, imp, mention from messages"
+            )
+            for entry in self.__iter_entries():
+                with db_connection.blobopen(
+                    "messages", "data", entry["data_rowid"], readonly=True
+                ) as data:
+                    blob = self._blob_parser.parse_blob(data)
+                yield entry, blob
+        else:
+            self._sqlite_db_cursor.execute("SELECT * from messages")
+            for entry in self.__iter_entries():
+                yield entry, self._blob_parser.parse_blob(entry["data"])
 
-        for entry in entries:
+    def __parse_table_messages(self):
+        for entry, blob in self.__iter_messages():
             mid = int(entry["mid"])
             assert mid
             assert mid not in self._table_messages
             logger.info("parsing messages, entry mid: %s", mid)
-            blob = self._blob_parser.parse_blob(entry["data"])
             replyblob = None
             if entry["replydata"]:
                 replyblob = self._blob_parser.parse_blob(entry["replydata"])
@@ -347,7 +396,7 @@ class tdb:
             self._table_messages[mid] = message
 
     def __save_table_messages(self, outdir):
-        with open(os.path.join(outdir, "table_messages.txt"), mode="w", encoding="utf-8") as fo:
+        with open_output_file(outdir, "table_messages.txt") as fo:
             for mid, tmsg in self._table_messages.items():
                 fo.write("-" * 80)
                 fo.write(
@@ -379,14 +428,11 @@ class tdb:
 
     def __parse_table_sent_files_v2(self):
         self._sqlite_db_cursor.execute("SELECT * from sent_files_v2")
-        entries = self._sqlite_db_cursor.fetchall()
-
-        for entry in entries:
+        for entry, blob in self.__iter_entries_blobs("data", "uid"):
             uid = entry["uid"]
             assert uid
             assert uid not in self._table_sent_files
             logger.info("parsing sent_files_v2, entry uid: %s", uid)
-            blob = self._blob_parser.parse_blob(entry["data"])
             # Some old telegram versions have not 'type' / 'parent'.
             entry_type = getattr(entry, "type", None)
             entry_parent = getattr(entry, "parent", None)
@@ -394,9 +440,7 @@ class tdb:
             self._table_sent_files[uid] = sentfile
 
     def __save_table_sent_files_v2(self, outdir):
-        with open(
-            os.path.join(outdir, "table_sent_files_v2.txt"), mode="w", encoding="utf-8"
-        ) as fo:
+        with open_output_file(outdir, "table_sent_files_v2.txt") as fo:
             for uid, sentfile in self._table_sent_files.items():
                 assert uid == sentfile.uid
                 fo.write("-" * 80)
@@ -409,15 +453,12 @@ class tdb:
 
     def __parse_table_users(self):
         self._sqlite_db_cursor.execute("SELECT * from users")
-        entries = self._sqlite_db_cursor.fetchall()
-
         user_self_set = False
-        for entry in entries:
+        for entry, blob in self.__iter_entries_blobs("data", "uid"):
             uid = int(entry["uid"])
             assert uid
             assert uid not in self._table_users
             logger.info("parsing users, entry uid: %s", uid)
-            blob = self._blob_parser.parse_blob(entry["data"])
             user = tuser(uid, entry["name"], entry["status"], blob)
 
             if user.is_self:
@@ -428,7 +469,7 @@ class tdb:
         assert user_self_set
 
     def __save_table_users(self, outdir):
-        with open(os.path.join(outdir, "table_users.txt"), mode="w", encoding="utf-8") as fo:
+        with open_output_file(outdir, "table_users.txt") as fo:
             for uid, user in self._table_users.items():
                 assert uid == user.uid
                 fo.write("-" * 80)
@@ -445,24 +486,27 @@ class tdb:
     def __parse_table_user_settings(self):
         try:
             self._sqlite_db_cursor.execute("SELECT * from user_settings")
-            entries = self._sqlite_db_cursor.fetchall()
         except Exception as ee:
             logger.error("Exception accessing user_settings table. %s", str(ee))
             return
 
-        for entry in entries:
-            uid = int(entry["uid"])
-            assert uid
-            assert uid not in self._table_user_settings
-            logger.info("parsing user_settings, entry uid: %s", uid)
-            blob = self._blob_parser.parse_blob(entry["info"])
-            tus = tuser_settings(uid, blob, entry["pinned"])
-            self._table_user_settings[uid] = tus
+        # Rows are fetched while iterating, so errors reading the table can
+        # still show up here: the table is then skipped as a whole rather
+        # than saved partially parsed.
+        try:
+            for entry, blob in self.__iter_entries_blobs("info", "uid"):
+                uid = int(entry["uid"])
+                assert uid
+                assert uid not in self._table_user_settings
+                logger.info("parsing user_settings, entry uid: %s", uid)
+                tus = tuser_settings(uid, blob, entry["pinned"])
+                self._table_user_settings[uid] = tus
+        except Exception as ee:
+            logger.error("Exception accessing user_settings table. %s", str(ee))
+            self._table_user_settings.clear()
 
     def __save_table_user_settings(self, outdir):
-        with open(
-            os.path.join(outdir, "table_user_settings.txt"), mode="w", encoding="utf-8"
-        ) as fo:
+        with open_output_file(outdir, "table_user_settings.txt") as fo:
             for uid, tus in self._table_user_settings.items():
                 fo.write("-" * 80)
                 fo.write("\nuid: {} pinned: {}".format(uid, tus.pinned))
@@ -779,9 +823,7 @@ class tdb:
             yield row
 
     def create_timeline(self):
-        with open(
-            os.path.join(self._outdirectory, "timeline.csv"), mode="w", encoding="utf-8"
-        ) as fo:
+        with open_output_file(self._outdirectory, "timeline.csv") as fo:
             fo.write("{}\n".format(self._separator.join(trow.fieldsnames())))
 
             for row in self.__chats_to_timeline():
@@ -42,27 +42,69 @@
 
 # pylint: disable= C0103,C0116
 
+import os
 import sqlite3
-import tblob
-import tdb
 
 VERSION = "20200807"
 
+# The database is only read: let sqlite keep its temporary structures in
+# memory and use a large page cache for the bulk table scans. The whole file
+# is also memory mapped, see process.
+SQLITE_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+)
 
-def process(infilename, outdirectory):
+# Files holding changes not yet merged into the database, see process.
+SQLITE_JOURNAL_SUFFIXES = ("-wal", "-journal")
+
+
+def prefetch_file(filename):
+    """Asks the OS to start reading the whole file in the background"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(filename, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def process(infilename, outdirectory, workers=1):
+    # The parsers, construct included, are only loaded when actually needed:
+    # --help, the command line checks and setup.py do not pay for them.
+    import tblob  # pylint: disable=C0415
+    import tdb  # pylint: disable=C0415
 
     db_connection = None
     db_uri = "file:" + infilename + "?mode=ro"
+    # Without pending changes the database is opened as immutable: sqlite
+    # then skips the file locking and the journal checks altogether.
+    if not any(os.path.exists(infilename + suffix) for suffix in SQLITE_JOURNAL_SUFFIXES):
+        db_uri += "&immutable=1"
+
+    # Every table is scanned in full: the scattered blob pages are then read
+    # from the page cache of the OS instead of one small random read each.
+    prefetch_file(infilename)
 
-    tparse = tblob.tblob()
+    tparse = tblob.tblob(workers)
 
-    with sqlite3.connect(db_uri, uri=True) as db_connection:
+    with sqlite3.connect(db_uri, uri=True, isolation_level=None) as db_connection:
+        for pragma in SQLITE_PRAGMAS:
+            db_connection.execute(pragma)
+        # Mapping the whole file lets sqlite read the pages, blobs included,
+        # straight from the page cache of the OS instead of copying them.
+        db_connection.execute("PRAGMA mmap_size={}".format(os.path.getsize(infilename)))
         db_connection.text_factory = bytes
         db_connection.row_factory = sqlite3.Row
         db_cursor = db_connection.cursor()
 
         teledb = tdb.tdb(outdirectory, tparse, db_cursor)
-        teledb.parse()
+        try:
+            teledb.parse()
+        finally:
+            tparse.close()
 
     teledb.save_parsed_tables()
     teledb.create_timeline()  # TODO: address crash in this method